@@ -1,18 +0,0 @@
-"""Services package."""
-
-from src.services.score_strategies import RubricScorer
-from src.services.prompt_analyzer import PromptAnalyzer
-from src.services.feedback_generator import FeedbackGenerator
-from src.services.lesson_manager import LessonManager
-from src.services.prompt_demonstrator import PromptDemonstrator
-from src.services.antagonistic_services import FrustrationAnalyzer, OppositeDoer
-
-__all__ = [
-    "RubricScorer",
-    "PromptAnalyzer",
-    "FeedbackGenerator",
-    "LessonManager",
-    "PromptDemonstrator",
-    "FrustrationAnalyzer",
-    "OppositeDoer",
-]
\ No newline at end of file
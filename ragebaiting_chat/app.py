@@ -6,6 +6,14 @@ Demonstrates SOLID principles and clean architecture in action.
 """
 
 import os
+import pickle
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property, wraps
+from itertools import islice
+
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -17,12 +25,66 @@ from src.services import (
     LessonManager,
     PromptDemonstrator,
 )
-from src.models import UserProgress, PromptAnalysis
-from src.infrastructure import OpenAIClient
+from src.models import UserProgress, Lesson
 
 # Load environment variables
 load_dotenv()
 
+# Feedback styles offered in the sidebar, with their selectbox positions
+FEEDBACK_STYLES = ("encouraging", "direct", "socratic")
+FEEDBACK_STYLE_INDEX = {style: i for i, style in enumerate(FEEDBACK_STYLES)}
+
+# Emoji shown next to each detected intent
+INTENT_EMOJI = {
+    "do_it_for_me": "🚫",
+    "help_me_learn": "✅",
+    "clarifying": "❓",
+    "reflection": "🤔",
+    "unknown": "❔"
+}
+
+
+def lesson_cache_key(lesson):
+    """Key a lesson by every field build_lesson_markdown renders."""
+    return (
+        lesson.description,
+        tuple(lesson.learning_objectives),
+        lesson.content,
+        tuple(
+            (exercise.prompt, tuple(exercise.hints), exercise.good_example, exercise.bad_example)
+            for exercise in lesson.exercises
+        ),
+    )
+
+
+def analyzer_cache_key(analyzer):
+    """Key an analyzer by its identity and its scorer's configuration."""
+    scorer = analyzer.scorer
+    return id(analyzer), id(scorer), repr(getattr(scorer, "weights", None))
+
+
+# Cache keys for the objects passed to st.cache_data functions. Each key
+# covers every field the cached output depends on, so edited lessons or a
+# reconfigured scorer miss the cache instead of serving stale results.
+HASH_FUNCS = {
+    Lesson: lesson_cache_key,
+    PromptAnalyzer: analyzer_cache_key,
+}
+
+# Static HTML, built once instead of on every rerun
+FOOTER_HTML = (
+    "<center>Built with ❤️ using SOLID principles and Test-Driven Development | "
+    "<a href='https://github.com'>View Source</a></center>"
+)
+BAD_RESPONSE_HTML = (
+    '<div style="background-color: #ffe6e6; padding: 15px; border-radius: 5px; '
+    'border-left: 4px solid #ff4444;">{}</div>'
+)
+GOOD_RESPONSE_HTML = (
+    '<div style="background-color: #e6f7e6; padding: 15px; border-radius: 5px; '
+    'border-left: 4px solid #44ff44;">{}</div>'
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Broken By Design",
@@ -32,29 +94,177 @@ st.set_page_config(
 )
 
 
+# Cache stats are recorded only while a session has the debug panel open,
+# or for every session when DEBUG_CACHE=1 is set
+DEBUG_CACHE = os.getenv("DEBUG_CACHE") == "1"
+
+
 @st.cache_resource
-def initialize_services():
-    """Initialize all services (cached to avoid recreation on reruns)."""
-    scorer = RubricScorer()
-    analyzer = PromptAnalyzer(scorer)
-    feedback_generator = FeedbackGenerator(style="encouraging")
-    lesson_manager = LessonManager()
-    lesson_manager.load_default_lessons()
+def get_cache_stats():
+    """Process-wide call/miss counters for tracked cached functions."""
+    return {"lock": threading.Lock(), "functions": {}}
+
+
+def cache_tracking_enabled():
+    """Whether cached calls in this run should be recorded."""
+    return DEBUG_CACHE or st.session_state.get("debug_cache", False)
+
+
+def approximate_size(value):
+    """
+    Estimate the memory a cached value takes, in bytes.
+    
+    Args:
+        value: Cached return value
+        
+    Returns:
+        Pickled size, or the shallow size if the value cannot be pickled
+    """
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def record_cache_event(name, event, size=0):
+    """
+    Count a call or miss of a tracked cached function.
+    
+    Args:
+        name: Name of the cached function
+        event: Either "calls" or "misses"
+        size: Approximate size of the value computed on a miss
+    """
+    stats = get_cache_stats()
+    with stats["lock"]:
+        entry = stats["functions"].setdefault(
+            name, {"calls": 0, "misses": 0, "approx_bytes": 0, "last_access": None}
+        )
+        entry[event] += 1
+        entry["approx_bytes"] += size
+        entry["last_access"] = datetime.now().isoformat(timespec="seconds")
+
+
+def tracked_cache(cache, **options):
+    """
+    Apply a Streamlit cache decorator and record its calls and misses.
     
-    # Initialize OpenAI client if API key available
-    api_key = os.getenv("OPENAI_API_KEY")
-    ai_client = OpenAIClient(api_key) if api_key else None
+    Recording is skipped unless cache_tracking_enabled(), so normal runs
+    only pay for one flag check per call.
+    
+    Args:
+        cache: st.cache_data or st.cache_resource
+        **options: Options passed through to the cache decorator
+        
+    Returns:
+        Decorator producing the cached function
+    """
+    def decorator(func):
+        @wraps(func)
+        def compute(*args, **kwargs):
+            # Only runs when the cache misses
+            result = func(*args, **kwargs)
+            if cache_tracking_enabled():
+                record_cache_event(func.__name__, "misses", approximate_size(result))
+            return result
+        
+        cached = cache(**options)(compute)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if cache_tracking_enabled():
+                record_cache_event(func.__name__, "calls")
+            return cached(*args, **kwargs)
+        
+        wrapper.clear = cached.clear
+        return wrapper
     
-    # Initialize demonstrator with AI client
-    demonstrator = PromptDemonstrator(ai_client)
+    return decorator
+
+
+def render_cache_stats():
+    """Show hit/miss counts and approximate sizes for tracked cached functions."""
+    stats = get_cache_stats()
+    with stats["lock"]:
+        report = {
+            name: {**entry, "hits": entry["calls"] - entry["misses"]}
+            for name, entry in stats["functions"].items()
+        }
+    st.json(report)
+
+
+@dataclass
+class Services:
+    """Application services, each built on first access."""
+
+    @cached_property
+    def analyzer(self):
+        """Prompt analyzer backed by the rubric scorer."""
+        return PromptAnalyzer(RubricScorer())
+
+    @cached_property
+    def feedback_generator(self):
+        """Feedback generator (each session passes its own style)."""
+        return FeedbackGenerator(style="encouraging")
+
+    @cached_property
+    def lesson_manager(self):
+        """Lesson catalog with the default lessons loaded."""
+        lesson_manager = LessonManager()
+        lesson_manager.load_default_lessons()
+        return lesson_manager
+
+    @cached_property
+    def api_key(self):
+        """OpenAI API key from the environment, read once per process."""
+        return os.getenv("OPENAI_API_KEY")
+
+    @cached_property
+    def demonstrator(self):
+        """Demonstrator using OpenAI when an API key is configured."""
+        if not self.api_key:
+            return PromptDemonstrator()
+
+        # Imported here so the OpenAI SDK only loads once live mode is used
+        from src.infrastructure import OpenAIClient, JsonFileCache
+
+        # Persist live responses on disk so repeat demonstrations
+        # survive restarts without API calls
+        ai_client = OpenAIClient(self.api_key)
+        response_cache = JsonFileCache(
+            f".streamlit/cache/demonstrations-{ai_client.model}.json",
+            max_entries=1024
+        )
+        return PromptDemonstrator(ai_client, response_cache)
+
+
+@tracked_cache(st.cache_resource)
+def initialize_services():
+    """Initialize the service container (cached to avoid recreation on reruns)."""
+    return Services()
+
+
+def format_metrics_table(metrics):
+    """
+    Format metrics as a single-row markdown table.
     
-    return scorer, analyzer, feedback_generator, lesson_manager, ai_client, demonstrator
+    Args:
+        metrics: Mapping of metric label to displayed value
+        
+    Returns:
+        Markdown table with one column per metric
+    """
+    return "\n".join([
+        "| " + " | ".join(metrics) + " |",
+        "|" + " :---: |" * len(metrics),
+        "| " + " | ".join(str(value) for value in metrics.values()) + " |",
+    ])
 
 
 def initialize_session_state():
-    """Initialize session state variables."""
-    if 'progress' not in st.session_state:
-        st.session_state.progress = UserProgress(
+    """Initialize missing session state variables in a single update."""
+    defaults = {
+        "progress": lambda: UserProgress(
             user_id="streamlit_user",
             current_lesson=1,
             completed_lessons=[],
@@ -62,85 +272,113 @@ def initialize_session_state():
             skill_level=1,
             total_prompts=0,
             good_prompts=0
+        ),
+        "feedback_style": lambda: "encouraging",
+        "current_analysis": lambda: None,
+        "current_demonstration": lambda: None,
+        "user_email": lambda: None,
+    }
+    
+    # Defaults are factories so existing sessions never build unused objects
+    missing = {key: make() for key, make in defaults.items() if key not in st.session_state}
+    if missing:
+        st.session_state.update(missing)
+
+
+def clear_email():
+    """Button callback: stop saving progress to the current email."""
+    st.session_state.user_email = None
+
+
+def save_email():
+    """Button callback: save progress to the entered email if it looks valid."""
+    email_input = st.session_state.email_input
+    if email_input and "@" in email_input:
+        st.session_state.user_email = email_input
+        st.session_state.progress.user_id = email_input
+
+
+@st.fragment
+def render_sidebar(lesson_manager):
+    """Render sidebar with navigation and progress (call inside st.sidebar)."""
+    st.title("🎓 Broken by Design")
+    st.markdown("---")
+    
+    # Optional email for saving progress
+    st.subheader("💾 Save Your Progress")
+    if st.session_state.user_email:
+        st.success(f"✅ Saving to: {st.session_state.user_email}")
+        st.button("🔓 Change Email", use_container_width=True, on_click=clear_email)
+    else:
+        email_input = st.text_input(
+            "Email (optional)",
+            placeholder="your.email@example.com",
+            help="Enter your email to save your lessons and progress data",
+            key="email_input"
         )
+        # A valid email is saved by the callback before this rerun renders
+        if st.button("💾 Save My Progress", use_container_width=True, on_click=save_email):
+            if email_input:
+                st.error("Please enter a valid email address")
     
-    if 'feedback_style' not in st.session_state:
-        st.session_state.feedback_style = "encouraging"
+    st.markdown("---")
     
-    if 'current_analysis' not in st.session_state:
-        st.session_state.current_analysis = None
+    # Progress metrics
+    st.subheader("📊 Your Progress")
+    progress = st.session_state.progress
+    st.markdown(format_metrics_table({
+        "Total Prompts": progress.total_prompts,
+        "Good Prompts": progress.good_prompts,
+        "Skill Level": progress.skill_level,
+        "Success Rate": f"{progress.success_rate:.1f}%",
+    }))
     
-    if 'user_email' not in st.session_state:
-        st.session_state.user_email = None
+    st.markdown("---")
+    
+    # Feedback style selector
+    st.subheader("💬 Feedback Style")
+    feedback_style = st.selectbox(
+        "Choose your feedback style:",
+        options=FEEDBACK_STYLES,
+        index=FEEDBACK_STYLE_INDEX[st.session_state.feedback_style],
+        help="Encouraging: Positive and supportive\nDirect: Straightforward facts\nSocratic: Question-based reflection"
+    )
+    if feedback_style != st.session_state.feedback_style:
+        st.session_state.feedback_style = feedback_style
+        # The analyzer tab renders feedback in this style
+        st.rerun(scope="app")
+    
+    st.markdown("---")
+    
+    # Available lessons
+    st.subheader("📚 Available Lessons")
+    for lesson in lesson_manager.get_all_lessons_sorted():
+        completed = "✅" if lesson.id in st.session_state.progress.completed_lessons else "📖"
+        st.markdown(f"{completed} **{lesson.title}**")
+        st.caption(f"Level {lesson.difficulty} - {lesson.description}")
+        st.markdown("")
+    
+    st.markdown("---")
+    if st.checkbox("🔧 Debug cache", key="debug_cache"):
+        render_cache_stats()
 
 
-def render_sidebar(lesson_manager):
-    """Render sidebar with navigation and progress."""
-    with st.sidebar:
-        st.title("🎓 Broken by Design")
-        st.markdown("---")
-        
-        # Optional email for saving progress
-        st.subheader("💾 Save Your Progress")
-        if st.session_state.user_email:
-            st.success(f"✅ Saving to: {st.session_state.user_email}")
-            if st.button("🔓 Change Email", use_container_width=True):
-                st.session_state.user_email = None
-                st.rerun()
-        else:
-            email_input = st.text_input(
-                "Email (optional)",
-                placeholder="your.email@example.com",
-                help="Enter your email to save your lessons and progress data"
-            )
-            if st.button("💾 Save My Progress", use_container_width=True):
-                if email_input and "@" in email_input:
-                    st.session_state.user_email = email_input
-                    st.session_state.progress.user_id = email_input
-                    st.success("✅ Progress will be saved!")
-                    st.rerun()
-                elif email_input:
-                    st.error("Please enter a valid email address")
-        
-        st.markdown("---")
-        
-        # Progress metrics
-        st.subheader("📊 Your Progress")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Prompts", st.session_state.progress.total_prompts)
-            st.metric("Skill Level", st.session_state.progress.skill_level)
-        with col2:
-            st.metric("Good Prompts", st.session_state.progress.good_prompts)
-            success_rate = st.session_state.progress.success_rate
-            st.metric("Success Rate", f"{success_rate:.1f}%")
-        
-        st.markdown("---")
-        
-        # Feedback style selector
-        st.subheader("💬 Feedback Style")
-        feedback_style = st.selectbox(
-            "Choose your feedback style:",
-            options=["encouraging", "direct", "socratic"],
-            index=["encouraging", "direct", "socratic"].index(st.session_state.feedback_style),
-            help="Encouraging: Positive and supportive\nDirect: Straightforward facts\nSocratic: Question-based reflection"
-        )
-        if feedback_style != st.session_state.feedback_style:
-            st.session_state.feedback_style = feedback_style
-            st.rerun()
-        
-        st.markdown("---")
+@tracked_cache(st.cache_data, hash_funcs=HASH_FUNCS, show_spinner=False)
+def evaluate_prompt(analyzer, prompt):
+    """
+    Evaluate a prompt, reusing earlier results for the same text.
+    
+    Args:
+        analyzer: Process-wide prompt analyzer
+        prompt: Prompt text to evaluate
         
-        # Available lessons
-        st.subheader("📚 Available Lessons")
-        all_lessons = lesson_manager.get_all_lessons()
-        for lesson in sorted(all_lessons, key=lambda x: x.difficulty):
-            completed = "✅" if lesson.id in st.session_state.progress.completed_lessons else "📖"
-            st.markdown(f"{completed} **{lesson.title}**")
-            st.caption(f"Level {lesson.difficulty} - {lesson.description}")
-            st.markdown("")
+    Returns:
+        PromptAnalysis for the prompt
+    """
+    return analyzer.evaluate(prompt)
 
 
+@st.fragment
 def render_prompt_analyzer(analyzer, feedback_generator):
     """Render the main prompt analysis interface."""
     st.header("✍️ Prompt Analysis")
@@ -161,24 +399,23 @@ def render_prompt_analyzer(analyzer, feedback_generator):
     with col2:
         if st.button("🗑️ Clear", use_container_width=True):
             st.session_state.current_analysis = None
-            st.rerun()
     
-    if analyze_button and user_prompt.strip():
+    current_analysis = st.session_state.current_analysis
+    if analyze_button and current_analysis and current_analysis.prompt == user_prompt:
+        # Re-clicking without edits would only duplicate the history entry
+        st.info("Already analyzed - showing the result below.")
+    elif analyze_button and user_prompt.strip():
         with st.spinner("Analyzing your prompt..."):
             # Analyze the prompt
-            analysis = analyzer.evaluate(user_prompt)
-            
-            # Update progress
-            st.session_state.progress.total_prompts += 1
-            if analysis.score.is_passing:
-                st.session_state.progress.good_prompts += 1
+            analysis = evaluate_prompt(analyzer, user_prompt)
             
-            # Add to history
-            st.session_state.progress.prompt_history.append(analysis)
+            # Update progress and history
+            st.session_state.progress.record_prompt(analysis)
             
             # Store current analysis
             st.session_state.current_analysis = analysis
-            st.rerun()
+            # Sidebar progress and the History tab depend on this analysis
+            st.rerun(scope="app")
     
     # Display analysis results
     if st.session_state.current_analysis:
@@ -188,41 +425,68 @@ def render_prompt_analyzer(analyzer, feedback_generator):
         st.subheader("📈 Analysis Results")
         
         # Score metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            score_color = "🟢" if analysis.score.is_passing else "🔴"
-            st.metric(
-                "Overall Score",
-                f"{score_color} {analysis.score.total_score:.0f}/100",
-                delta="Passing" if analysis.score.is_passing else "Needs Work"
-            )
-        with col2:
-            st.metric("Learning", f"{analysis.score.learning_orientation:.0f}/100")
-        with col3:
-            st.metric("Specificity", f"{analysis.score.specificity:.0f}/100")
-        with col4:
-            st.metric("Engagement", f"{analysis.score.engagement:.0f}/100")
+        score_color = "🟢" if analysis.score.is_passing else "🔴"
+        st.markdown(format_metrics_table({
+            "Overall Score": (
+                f"{score_color} {analysis.score.total_score:.0f}/100 "
+                f"({'Passing' if analysis.score.is_passing else 'Needs Work'})"
+            ),
+            "Learning": f"{analysis.score.learning_orientation:.0f}/100",
+            "Specificity": f"{analysis.score.specificity:.0f}/100",
+            "Engagement": f"{analysis.score.engagement:.0f}/100",
+        }))
         
         # Intent badge
-        intent_emoji = {
-            "do_it_for_me": "🚫",
-            "help_me_learn": "✅",
-            "clarifying": "❓",
-            "reflection": "🤔",
-            "unknown": "❔"
-        }
-        st.markdown(f"**Intent:** {intent_emoji.get(analysis.score.intent.value, '❔')} {analysis.score.intent.value.replace('_', ' ').title()}")
+        intent = analysis.score.intent.value
+        st.markdown(f"**Intent:** {INTENT_EMOJI.get(intent, '❔')} {intent.replace('_', ' ').title()}")
         
         st.markdown("---")
         
         # Generate and display feedback
-        feedback_generator.style = st.session_state.feedback_style
-        feedback = feedback_generator.generate_feedback(analysis)
+        # The generator is shared by all sessions, so pass the style per call
+        feedback = feedback_generator.generate_feedback(
+            analysis, style=st.session_state.feedback_style
+        )
         
         st.subheader("💬 Personalized Feedback")
         st.markdown(feedback)
 
 
+@tracked_cache(st.cache_data, hash_funcs=HASH_FUNCS, show_spinner=False)
+def build_lesson_markdown(lesson):
+    """
+    Build the static markdown for a lesson.
+
+    Args:
+        lesson: Lesson to render
+
+    Returns:
+        Tuple of the lesson body and, per exercise, its heading and the
+        hints/examples shown inside its expander
+    """
+    objectives = "\n".join(f"- {obj}" for obj in lesson.learning_objectives)
+    body = (
+        f"**Description:** {lesson.description}\n\n"
+        f"**Learning Objectives:**\n{objectives}\n\n"
+        f"**Content:**\n{lesson.content}"
+    )
+    if lesson.exercises:
+        body += "\n\n**Exercises:**"
+    
+    exercises = tuple(
+        (
+            f"{i}. {exercise.prompt}",
+            "**Hints:**\n\n"
+            + "".join(f"💡 {hint}\n\n" for hint in exercise.hints)
+            + f"**Good Example:** {exercise.good_example}\n\n"
+            f"**Bad Example:** ❌ {exercise.bad_example}"
+        )
+        for i, exercise in enumerate(lesson.exercises, 1)
+    )
+    return body, exercises
+
+
+@st.fragment
 def render_lessons(lesson_manager):
     """Render lessons interface."""
     st.header("📚 Lessons")
@@ -233,45 +497,66 @@ def render_lessons(lesson_manager):
     if next_lesson:
         st.info(f"🎯 **Recommended:** {next_lesson.title} (Level {next_lesson.difficulty})")
     
-    # Display all lessons
+    # Display one lesson at a time, picked by level, so only its body renders
     st.markdown("### All Lessons")
     
-    all_lessons = lesson_manager.get_all_lessons()
-    for lesson in sorted(all_lessons, key=lambda x: x.difficulty):
-        is_completed = lesson.id in st.session_state.progress.completed_lessons
-        
-        with st.expander(f"{'✅' if is_completed else '📖'} {lesson.title} - Level {lesson.difficulty}"):
-            st.markdown(f"**Description:** {lesson.description}")
-            
-            st.markdown("**Learning Objectives:**")
-            for obj in lesson.learning_objectives:
-                st.markdown(f"- {obj}")
-            
-            st.markdown(f"**Content:**\n{lesson.content}")
-            
-            if lesson.exercises:
-                st.markdown("**Exercises:**")
-                for i, exercise in enumerate(lesson.exercises, 1):
-                    st.markdown(f"{i}. {exercise.prompt}")
-                    with st.expander("View hints and examples"):
-                        st.markdown("**Hints:**")
-                        for hint in exercise.hints:
-                            st.markdown(f"💡 {hint}")
-                        st.markdown(f"**Good Example:** {exercise.good_example}")
-                        st.markdown(f"**Bad Example:** ❌ {exercise.bad_example}")
-            
-            if not is_completed:
-                if st.button(f"Mark '{lesson.title}' as Complete", key=f"complete_{lesson.id}"):
-                    st.session_state.progress.completed_lessons.append(lesson.id)
-                    # Update skill level based on completed lessons
-                    completed_count = len(st.session_state.progress.completed_lessons)
-                    new_skill = min(5, 1 + (completed_count // 2))
-                    st.session_state.progress.skill_level = new_skill
-                    st.success(f"🎉 Completed {lesson.title}!")
-                    st.rerun()
-
-
-def render_history():
+    levels = list(dict.fromkeys(
+        lesson.difficulty for lesson in lesson_manager.get_all_lessons_sorted()
+    ))
+    if not levels:
+        return
+    
+    level = st.radio(
+        "Level",
+        options=levels,
+        format_func=lambda level: f"Level {level}",
+        horizontal=True,
+        key="lesson_level"
+    )
+    lessons = {lesson.id: lesson for lesson in lesson_manager.get_lessons_by_level(level)}
+    completed_lessons = st.session_state.progress.completed_lessons
+    
+    lesson_id = st.selectbox(
+        "Lesson",
+        options=list(lessons),
+        format_func=lambda lesson_id: (
+            f"{'✅' if lesson_id in completed_lessons else '📖'} {lessons[lesson_id].title}"
+        ),
+        key=f"lesson_choice_{level}"
+    )
+    lesson = lessons[lesson_id]
+    is_completed = lesson.id in completed_lessons
+    
+    # One markdown element for the body and one per exercise
+    body, exercises = build_lesson_markdown(lesson)
+    st.markdown(body)
+    for exercise_heading, exercise_details in exercises:
+        st.markdown(exercise_heading)
+        with st.expander("View hints and examples"):
+            st.markdown(exercise_details)
+    
+    if not is_completed:
+        if st.button(f"Mark '{lesson.title}' as Complete", key=f"complete_{lesson.id}"):
+            st.session_state.progress.completed_lessons.append(lesson.id)
+            # Update skill level based on completed lessons
+            completed_count = len(st.session_state.progress.completed_lessons)
+            new_skill = min(5, 1 + (completed_count // 2))
+            st.session_state.progress.skill_level = new_skill
+            st.success(f"🎉 Completed {lesson.title}!")
+            # Sidebar lesson list shows completion too
+            st.rerun(scope="app")
+
+
+def reanalyze_history(analyzer):
+    """Button callback: re-score every history entry in one batch."""
+    progress = st.session_state.progress
+    analyses = analyzer.evaluate_batch([analysis.prompt for analysis in progress.prompt_history])
+    # Keeps the good-prompt count and success rate in line with the new scores
+    progress.replace_history(analyses)
+
+
+@st.fragment
+def render_history(analyzer):
     """Render prompt history."""
     st.header("📜 Prompt History")
     
@@ -279,35 +564,61 @@ def render_history():
         st.info("No prompts analyzed yet. Go to the Prompt Analyzer to get started!")
         return
     
-    st.markdown(f"**Total prompts analyzed:** {len(st.session_state.progress.prompt_history)}")
+    st.markdown(f"**Total prompts analyzed:** {st.session_state.progress.total_prompts}")
+    st.button(
+        "↻ Re-analyze all with current rubric",
+        on_click=reanalyze_history,
+        args=(analyzer,)
+    )
     
     # Show recent prompts (last 10)
-    recent_prompts = list(reversed(st.session_state.progress.prompt_history[-10:]))
-    
-    for i, analysis in enumerate(recent_prompts, 1):
-        score_emoji = "✅" if analysis.score.is_passing else "❌"
-        with st.expander(f"{score_emoji} {analysis.prompt[:50]}... ({analysis.score.total_score:.0f}/100)"):
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Learning", f"{analysis.score.learning_orientation:.0f}")
-            with col2:
-                st.metric("Specificity", f"{analysis.score.specificity:.0f}")
-            with col3:
-                st.metric("Engagement", f"{analysis.score.engagement:.0f}")
-            
-            if analysis.strengths:
-                st.markdown("**Strengths:**")
-                for strength in analysis.strengths:
-                    st.markdown(f"✓ {strength}")
-            
-            if analysis.detected_patterns:
-                st.markdown("**Issues:**")
-                for pattern in analysis.detected_patterns:
-                    st.markdown(f"⚠️ {pattern}")
+    recent_prompts = list(islice(reversed(st.session_state.progress.prompt_history), 10))
+    
+    # Only the selected prompt's details are rendered
+    choice = st.selectbox(
+        "Recent prompts",
+        options=range(len(recent_prompts)),
+        format_func=lambda i: (
+            f"{'✅' if recent_prompts[i].score.is_passing else '❌'} "
+            f"{recent_prompts[i].prompt[:50]}... ({recent_prompts[i].score.total_score:.0f}/100)"
+        ),
+        key="history_choice"
+    )
+    analysis = recent_prompts[choice]
+    
+    st.markdown(format_metrics_table({
+        "Learning": f"{analysis.score.learning_orientation:.0f}",
+        "Specificity": f"{analysis.score.specificity:.0f}",
+        "Engagement": f"{analysis.score.engagement:.0f}",
+    }))
+    
+    if analysis.strengths:
+        st.markdown("**Strengths:**")
+        for strength in analysis.strengths:
+            st.markdown(f"✓ {strength}")
+    
+    if analysis.detected_patterns:
+        st.markdown("**Issues:**")
+        for pattern in analysis.detected_patterns:
+            st.markdown(f"⚠️ {pattern}")
+
+
+def clear_demonstration():
+    """Button callback: remove the current demonstration."""
+    st.session_state.current_demonstration = None
 
 
-def render_demonstration(demonstrator, ai_client):
-    """Render the 'See It In Action' demonstration interface."""
+@st.fragment
+def render_demonstration(live_mode):
+    """
+    Render the 'See It In Action' demonstration interface.
+    
+    The demonstrator (and with it the OpenAI SDK) is only built once a
+    demonstration is first requested.
+    
+    Args:
+        live_mode: Whether an OpenAI API key is configured
+    """
     st.header("🎭 See It In Action")
     st.markdown("""
     **Experience the difference between bad and good prompts in real-time.**
@@ -317,7 +628,7 @@ def render_demonstration(demonstrator, ai_client):
     """)
     
     # Check if API is available
-    if not ai_client:
+    if not live_mode:
         st.info("💡 **Demo Mode**: Using simulated responses (OpenAI API key not configured)")
     else:
         st.success("✅ **Live Mode**: Using real OpenAI API responses")
@@ -349,17 +660,30 @@ def render_demonstration(demonstrator, ai_client):
         )
     
     if demonstrate_button and user_prompt.strip():
+        # Live responses stream into these placeholders as tokens arrive
+        stream_col1, stream_col2 = st.columns(2)
+        placeholders = {"bad": stream_col1.empty(), "good": stream_col2.empty()}
+        streamed_text = {"bad": "", "good": ""}
+
+        def show_delta(side, text):
+            streamed_text[side] += text
+            placeholders[side].markdown(streamed_text[side])
+
         with st.spinner("Generating responses... This may take a few seconds"):
             # Get demonstration
             improved_prompt = custom_improved.strip() if custom_improved.strip() else None
-            result = demonstrator.demonstrate(user_prompt, improved_prompt)
+            demonstrator = initialize_services().demonstrator
+            result = demonstrator.demonstrate(user_prompt, improved_prompt, on_delta=show_delta)
             
             # Store in session state
             st.session_state.current_demonstration = result
-            st.rerun()
+
+        # The full comparison below replaces the streamed preview
+        for placeholder in placeholders.values():
+            placeholder.empty()
     
     # Display results
-    if 'current_demonstration' in st.session_state and st.session_state.current_demonstration:
+    if st.session_state.current_demonstration:
         result = st.session_state.current_demonstration
         
         st.markdown("---")
@@ -379,7 +703,7 @@ def render_demonstration(demonstrator, ai_client):
             st.markdown("**AI Response:**")
             with st.container():
                 st.markdown(
-                    f'<div style="background-color: #ffe6e6; padding: 15px; border-radius: 5px; border-left: 4px solid #ff4444;">{result.bad_response}</div>',
+                    BAD_RESPONSE_HTML.format(result.bad_response),
                     unsafe_allow_html=True
                 )
             st.caption("⚠️ Unhelpful: Just gives answers without teaching")
@@ -390,7 +714,7 @@ def render_demonstration(demonstrator, ai_client):
             st.markdown("**AI Response:**")
             with st.container():
                 st.markdown(
-                    f'<div style="background-color: #e6f7e6; padding: 15px; border-radius: 5px; border-left: 4px solid #44ff44;">{result.good_response}</div>',
+                    GOOD_RESPONSE_HTML.format(result.good_response),
                     unsafe_allow_html=True
                 )
             st.caption("✅ Helpful: Explains, demonstrates, and encourages practice")
@@ -401,23 +725,22 @@ def render_demonstration(demonstrator, ai_client):
         st.markdown(result.explanation)
         
         # Clear button
-        if st.button("🗑️ Clear Demo", use_container_width=False):
-            st.session_state.current_demonstration = None
-            st.rerun()
+        st.button("🗑️ Clear Demo", use_container_width=False, on_click=clear_demonstration)
 
 
 def main():
     """Main application entry point."""
     # Initialize
     initialize_session_state()
-    scorer, analyzer, feedback_generator, lesson_manager, ai_client, demonstrator = initialize_services()
+    services = initialize_services()
     
     # Check API key
-    if not os.getenv("OPENAI_API_KEY"):
+    if not services.api_key:
         st.warning("⚠️ OpenAI API key not found. Demo mode will use simulated responses. Add OPENAI_API_KEY to your .env file for live demonstrations.")
     
     # Render sidebar
-    render_sidebar(lesson_manager)
+    with st.sidebar:
+        render_sidebar(services.lesson_manager)
     
     # Main content tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -428,24 +751,20 @@ def main():
     ])
     
     with tab1:
-        render_prompt_analyzer(analyzer, feedback_generator)
+        render_prompt_analyzer(services.analyzer, services.feedback_generator)
     
     with tab2:
-        render_demonstration(demonstrator, ai_client)
+        render_demonstration(bool(services.api_key))
     
     with tab3:
-        render_lessons(lesson_manager)
+        render_lessons(services.lesson_manager)
     
     with tab4:
-        render_history()
+        render_history(services.analyzer)
     
     # Footer
     st.markdown("---")
-    st.markdown(
-        "<center>Built with ❤️ using SOLID principles and Test-Driven Development | "
-        "<a href='https://github.com'>View Source</a></center>",
-        unsafe_allow_html=True
-    )
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ Uses a God Object that does everything in one massive class.
 Educational value: Shows WHY we use SOLID principles by breaking them all.
 """
 
+import html
 import streamlit as st
 from src.services.god_object import GodObject
 
@@ -31,34 +32,50 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Violation: Hardcoded state tables keyed by raw strings instead of an enum
+# (built once at import rather than on every rerun)
+STATE_EMOJI = {
+    "optimistic": "😊",
+    "confused": "🤔",
+    "frustrated": "😤",
+    "angry": "😠",
+    "enraged": "🤬",
+    "broken": "💀",
+    "transcendent": "🧘"
+}
+
+STATE_DESCRIPTIONS = {
+    "optimistic": "Fresh and hopeful! This AI will surely help me...",
+    "confused": "Wait, that's not what I asked for...",
+    "frustrated": "Why won't it just answer my question?!",
+    "angry": "This is ridiculous! Just do what I ask!",
+    "enraged": "CAPS LOCK ENGAGED. RAGE MODE ACTIVATED.",
+    "broken": "I give up. This is pointless. Everything is pointless.",
+    "transcendent": "Beyond anger. Beyond hope. One with the void."
+}
+
+# Progress bar (hardcoded values)
+STATE_PROGRESS = {
+    "optimistic": 0,
+    "confused": 16,
+    "frustrated": 33,
+    "angry": 50,
+    "enraged": 66,
+    "broken": 83,
+    "transcendent": 100
+}
+
+
 # Violation: Global function instead of method in a class
 def get_emoji_for_state(state: str) -> str:
     """Hardcoded emoji mapping."""
-    emojis = {
-        "optimistic": "😊",
-        "confused": "🤔", 
-        "frustrated": "😤",
-        "angry": "😠",
-        "enraged": "🤬",
-        "broken": "💀",
-        "transcendent": "🧘"
-    }
-    return emojis.get(state, "😊")
+    return STATE_EMOJI.get(state, "😊")
 
 
 # Violation: Global function with hardcoded logic
 def get_state_description(state: str) -> str:
     """Hardcoded state descriptions."""
-    descriptions = {
-        "optimistic": "Fresh and hopeful! This AI will surely help me...",
-        "confused": "Wait, that's not what I asked for...",
-        "frustrated": "Why won't it just answer my question?!",
-        "angry": "This is ridiculous! Just do what I ask!",
-        "enraged": "CAPS LOCK ENGAGED. RAGE MODE ACTIVATED.",
-        "broken": "I give up. This is pointless. Everything is pointless.",
-        "transcendent": "Beyond anger. Beyond hope. One with the void."
-    }
-    return descriptions.get(state, "")
+    return STATE_DESCRIPTIONS.get(state, "")
 
 
 # Violation: Initialize god object globally instead of dependency injection
@@ -145,7 +162,7 @@ def main():
             st.rerun()
         return
     
-    # Display frustration meter
+    # Display frustration meter (stats are reused below on this rerun)
     stats = god.get_stats()
     if stats.get("active"):
         emoji = get_emoji_for_state(god.current_state)
@@ -158,18 +175,7 @@ def main():
             unsafe_allow_html=True
         )
         st.info(get_state_description(god.current_state))
-        
-        # Progress bar (hardcoded values)
-        progress_map = {
-            "optimistic": 0,
-            "confused": 16,
-            "frustrated": 33,
-            "angry": 50,
-            "enraged": 66,
-            "broken": 83,
-            "transcendent": 100
-        }
-        st.progress(progress_map.get(god.current_state, 0) / 100.0)
+        st.progress(STATE_PROGRESS.get(god.current_state, 0) / 100.0)
     
     st.markdown("---")
     
@@ -185,7 +191,6 @@ def main():
         send = st.button("📤 Send Message", use_container_width=True)
     with col2:
         # Inline logic instead of separate method
-        stats = god.get_stats()
         if stats.get("active") and stats["attempts"] >= 5:
             if st.button("🏳️ Give Up", use_container_width=True, type="primary"):
                 # Call the god object
@@ -194,6 +199,8 @@ def main():
                     st.session_state.final_result = result["result"]
                     st.session_state.show_result = True
                     st.rerun()
+                # The empty attempt still counts, so refresh for the sidebar
+                stats = god.get_stats()
     
     # Process message
     if send and user_input:
@@ -220,22 +227,21 @@ def main():
         st.subheader("💬 Conversation History")
         
         # Inline rendering instead of separate function
+        parts = []
         for msg in st.session_state.history:
-            st.markdown(
-                f'<div class="user-message"><strong>You:</strong> {msg["prompt"]}</div>',
-                unsafe_allow_html=True
-            )
-            st.markdown(
-                f'<div class="ai-message"><strong>AI:</strong> {msg["response"]}</div>',
-                unsafe_allow_html=True
+            prompt = html.escape(msg["prompt"], quote=False)
+            response = html.escape(msg["response"], quote=False)
+            parts.append(
+                f'<div class="user-message"><strong>You:</strong> {prompt}</div>'
+                f'<div class="ai-message"><strong>AI:</strong> {response}</div>'
             )
+        st.markdown("".join(parts), unsafe_allow_html=True)
     else:
         st.info("👆 Type a message above to start your descent into frustration...")
     
     # Sidebar (procedural style)
     with st.sidebar:
         st.markdown("### 📊 Session Stats")
-        stats = god.get_stats()
         if stats.get("active"):
             # Inline display instead of separate renderer
             st.write(f"**Attempts:** {stats['attempts']}")
@@ -7,6 +7,7 @@ Watch your emotional state deteriorate in real-time!
 "Getting Over It with Bennett Foddy" meets ChatGPT.
 """
 
+import html
 import streamlit as st
 from datetime import datetime
 from typing import Optional
@@ -157,33 +158,23 @@ def initialize_session_state():
         st.session_state.rage_quit_result = None
 
 
+# Emoji, progress (0-100%) and description for each state
+STATE_META = {
+    EmotionalState.OPTIMISTIC: ("😊", 0, "Fresh and hopeful! This AI will surely help me..."),
+    EmotionalState.CONFUSED: ("🤔", 16, "Wait, that's not what I asked for..."),
+    EmotionalState.FRUSTRATED: ("😤", 33, "Why won't it just answer my question?!"),
+    EmotionalState.ANGRY: ("😠", 50, "This is ridiculous! Just do what I ask!"),
+    EmotionalState.ENRAGED: ("🤬", 66, "CAPS LOCK ENGAGED. RAGE MODE ACTIVATED."),
+    EmotionalState.BROKEN: ("💀", 83, "I give up. This is pointless. Everything is pointless."),
+    EmotionalState.TRANSCENDENT: ("🧘", 100, "Beyond anger. Beyond hope. One with the void.")
+}
+DEFAULT_STATE_META = ("😊", 0, "")
+
+
 def render_frustration_meter(emotional_state: EmotionalState, attempt_count: int):
     """Render visual frustration meter showing emotional progression."""
     
-    # Emoji mapping for each state
-    state_emojis = {
-        EmotionalState.OPTIMISTIC: "😊",
-        EmotionalState.CONFUSED: "🤔",
-        EmotionalState.FRUSTRATED: "😤",
-        EmotionalState.ANGRY: "😠",
-        EmotionalState.ENRAGED: "🤬",
-        EmotionalState.BROKEN: "💀",
-        EmotionalState.TRANSCENDENT: "🧘"
-    }
-    
-    # Progress calculation (0-100%)
-    state_progress = {
-        EmotionalState.OPTIMISTIC: 0,
-        EmotionalState.CONFUSED: 16,
-        EmotionalState.FRUSTRATED: 33,
-        EmotionalState.ANGRY: 50,
-        EmotionalState.ENRAGED: 66,
-        EmotionalState.BROKEN: 83,
-        EmotionalState.TRANSCENDENT: 100
-    }
-    
-    progress = state_progress.get(emotional_state, 0)
-    emoji = state_emojis.get(emotional_state, "😊")
+    emoji, progress, description = STATE_META.get(emotional_state, DEFAULT_STATE_META)
     
     # Display attempt counter
     st.markdown(
@@ -203,18 +194,7 @@ def render_frustration_meter(emotional_state: EmotionalState, attempt_count: int
     # Progress bar
     st.progress(progress / 100.0)
     
-    # State description
-    descriptions = {
-        EmotionalState.OPTIMISTIC: "Fresh and hopeful! This AI will surely help me...",
-        EmotionalState.CONFUSED: "Wait, that's not what I asked for...",
-        EmotionalState.FRUSTRATED: "Why won't it just answer my question?!",
-        EmotionalState.ANGRY: "This is ridiculous! Just do what I ask!",
-        EmotionalState.ENRAGED: "CAPS LOCK ENGAGED. RAGE MODE ACTIVATED.",
-        EmotionalState.BROKEN: "I give up. This is pointless. Everything is pointless.",
-        EmotionalState.TRANSCENDENT: "Beyond anger. Beyond hope. One with the void."
-    }
-    
-    st.info(descriptions.get(emotional_state, ""))
+    st.info(description)
 
 
 def render_chat_history(chat_history: list):
@@ -222,22 +202,24 @@ def render_chat_history(chat_history: list):
     st.markdown("---")
     st.subheader("💬 Conversation History")
     
+    # One markdown element for the whole history instead of two per message
+    parts = []
     for message in chat_history:
         # User message
-        st.markdown(
+        parts.append(
             f'<div class="user-message">'
-            f'<strong>You:</strong> {message["prompt"]}'
-            f'</div>',
-            unsafe_allow_html=True
+            f'<strong>You:</strong> {html.escape(message["prompt"], quote=False)}'
+            f'</div>'
         )
         
         # AI response
-        st.markdown(
+        parts.append(
             f'<div class="ai-message">'
-            f'<strong>AI:</strong> {message["response"]}'
-            f'</div>',
-            unsafe_allow_html=True
+            f'<strong>AI:</strong> {html.escape(message["response"], quote=False)}'
+            f'</div>'
         )
+    
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
 
 def render_rage_quit_result(result: RageQuitResult):
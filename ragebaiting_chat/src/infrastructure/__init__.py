@@ -1,5 +1,35 @@
-"""Infrastructure package."""
+"""Infrastructure package.
 
-from src.infrastructure.openai_client import OpenAIClient
+Clients are imported on first access (PEP 562), so using the file cache
+does not load the OpenAI SDK.
+"""
 
-__all__ = ["OpenAIClient"]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.infrastructure.openai_client import OpenAIClient
+    from src.infrastructure.json_file_cache import JsonFileCache
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "OpenAIClient": "src.infrastructure.openai_client",
+    "JsonFileCache": "src.infrastructure.json_file_cache",
+}
+
+__all__ = ["OpenAIClient", "JsonFileCache"]
+
+
+def __getattr__(name):
+    """Import an infrastructure class on first access and cache it on the package."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily imported classes alongside loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
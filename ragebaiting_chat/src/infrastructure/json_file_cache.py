@@ -0,0 +1,88 @@
+"""
+JSON file cache implementation.
+
+A small persistent key/value store for caching API results across restarts.
+
+Demonstrates:
+- SRP: Single responsibility of persisting cached values
+- LSP: Behaves like any MutableMapping, so callers can swap in a plain dict
+"""
+
+import json
+import os
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+
+class JsonFileCache(MutableMapping):
+    """
+    Dictionary-like cache persisted to a JSON file.
+
+    Every write is flushed to disk, so entries survive server restarts.
+    Access is guarded by a lock because Streamlit serves each session
+    from its own thread. When max_entries is reached, the oldest entry
+    is evicted first.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        """
+        Initialize the cache, loading any entries already on disk.
+
+        Args:
+            path: Location of the JSON file backing the cache
+            max_entries: Optional limit on the number of cached entries
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = self._load()
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            return self._entries[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+
+            self._save()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+            self._save()
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> Dict[str, Any]:
+        """Read cached entries from disk, starting empty if unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self) -> None:
+        """Atomically write all entries to disk."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(self._entries, cache_file)
+        os.replace(temp_path, self.path)
@@ -8,11 +8,35 @@ Demonstrates:
 - SRP: Single responsibility of AI communication
 """
 
-from typing import Optional
-from openai import OpenAI
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from openai import DefaultHttpxClient, OpenAI, Timeout
 from src.interfaces import IAIClient
 from src.models import PromptIntent
 
+# Number of classified prompts kept per client
+INTENT_CACHE_SIZE = 1024
+
+# System prompt for intent classification, built once at import
+INTENT_SYSTEM_PROMPT = """You are an expert at analyzing student prompts.
+Classify the intent of the following prompt into one of these categories:
+- do_it_for_me: Student asking AI to complete their work
+- help_me_learn: Student asking for learning guidance
+- clarifying: Student asking for clarification
+- reflection: Student asking reflective questions
+- unknown: Cannot determine intent
+
+Respond with ONLY the category name, nothing else."""
+
+# Map classifier responses to PromptIntent
+INTENT_MAP = {intent.value: intent for intent in PromptIntent}
+
+# A category name is a few tokens, and classification should be repeatable
+INTENT_OPTIONS = {"max_tokens": 8, "temperature": 0.0}
+
+# Fail fast on unreachable hosts instead of the SDK's 10-minute default
+HTTP_TIMEOUT = Timeout(30.0, connect=5.0)
+
 
 class OpenAIClient(IAIClient):
     """
@@ -21,41 +45,56 @@ class OpenAIClient(IAIClient):
     Handles communication with OpenAI's API for chat and analysis.
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        classifier_model: str = "gpt-4o-mini"
+    ):
         """
         Initialize OpenAI client.
         
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini for cost efficiency)
+            classifier_model: Model for intent classification, kept cheap
+                              regardless of the chat model
         """
-        self.client = OpenAI(api_key=api_key)
+        # Each client owns its pool, so closing one never breaks another;
+        # keep-alive connections are reused across this client's calls
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=DefaultHttpxClient(timeout=HTTP_TIMEOUT)
+        )
         self.model = model
+        self.classifier_model = classifier_model
+        self._intent_cache: Dict[Tuple[str, str], PromptIntent] = {}
+        self._intent_cache_lock = threading.Lock()
     
-    def chat(self, message: str, system_prompt: Optional[str] = None) -> str:
+    def chat(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> str:
         """
         Send a chat message and get AI response.
         
         Args:
-            message: User message
+            messages: A single user message, or a list of message dicts
+                     with 'role' and 'content' (as IAIClient defines it)
             system_prompt: Optional system prompt to guide AI behavior
+                          (only used with a single user message)
+            **kwargs: Completion overrides (temperature, max_tokens, etc.)
             
         Returns:
             AI response text
         """
-        messages = []
-        
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        
-        messages.append({"role": "user", "content": message})
-        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=500
+                messages=self._build_messages(messages, system_prompt),
+                **self._build_options(kwargs)
             )
             
             return response.choices[0].message.content or ""
@@ -63,41 +102,97 @@ class OpenAIClient(IAIClient):
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
     
+    def stream_chat(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Send a chat message and yield the AI response as it streams in.
+        
+        Args:
+            messages: A single user message, or a list of message dicts
+            system_prompt: Optional system prompt (single message only)
+            **kwargs: Completion overrides (temperature, max_tokens, etc.)
+            
+        Yields:
+            Pieces of the AI response text as they arrive
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(messages, system_prompt),
+                stream=True,
+                **self._build_options(kwargs)
+            )
+            
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+    
+    def _build_messages(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        system_prompt: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Turn a single user message into a message list if needed."""
+        if not isinstance(messages, str):
+            return messages
+        
+        built = []
+        
+        if system_prompt:
+            built.append({"role": "system", "content": system_prompt})
+        
+        built.append({"role": "user", "content": messages})
+        return built
+    
+    def _build_options(self, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge completion overrides with the client defaults."""
+        options = {"temperature": 0.7, "max_tokens": 500}
+        options.update(overrides)
+        return options
+    
     def analyze_prompt_intent(self, prompt: str) -> PromptIntent:
         """
         Use AI to classify prompt intent.
         
+        Classifications use the classifier model and are cached per
+        classifier model and prompt, so a repeated prompt does not make
+        another API call. Failed calls are not cached.
+        
         Args:
             prompt: The prompt to analyze
             
         Returns:
             Classified intent
         """
-        system_prompt = """You are an expert at analyzing student prompts. 
-        Classify the intent of the following prompt into one of these categories:
-        - do_it_for_me: Student asking AI to complete their work
-        - help_me_learn: Student asking for learning guidance
-        - clarifying: Student asking for clarification
-        - reflection: Student asking reflective questions
-        - unknown: Cannot determine intent
-        
-        Respond with ONLY the category name, nothing else."""
+        key = (self.classifier_model, prompt)
+        with self._intent_cache_lock:
+            intent = self._intent_cache.get(key)
+        if intent is not None:
+            return intent
         
         try:
-            response = self.chat(prompt, system_prompt)
-            intent_str = response.strip().lower()
-            
-            # Map response to PromptIntent enum
-            intent_map = {
-                "do_it_for_me": PromptIntent.DO_IT_FOR_ME,
-                "help_me_learn": PromptIntent.HELP_ME_LEARN,
-                "clarifying": PromptIntent.CLARIFYING,
-                "reflection": PromptIntent.REFLECTION,
-                "unknown": PromptIntent.UNKNOWN
-            }
-            
-            return intent_map.get(intent_str, PromptIntent.UNKNOWN)
+            response = self.client.chat.completions.create(
+                model=self.classifier_model,
+                messages=self._build_messages(prompt, INTENT_SYSTEM_PROMPT),
+                **INTENT_OPTIONS
+            )
+            intent_str = (response.choices[0].message.content or "").strip().lower()
+            intent = INTENT_MAP.get(intent_str, PromptIntent.UNKNOWN)
         
         except Exception:
             # Fallback to UNKNOWN if API fails
             return PromptIntent.UNKNOWN
+        
+        with self._intent_cache_lock:
+            self._intent_cache[key] = intent
+            # Evict the oldest entries first
+            while len(self._intent_cache) > INTENT_CACHE_SIZE:
+                del self._intent_cache[next(iter(self._intent_cache))]
+        return intent
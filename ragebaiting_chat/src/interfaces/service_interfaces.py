@@ -6,18 +6,47 @@ Following:
 - Dependency Inversion Principle (DIP): High-level modules depend on these abstractions
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from abc import abstractmethod
+from typing import List, Optional, Dict, Any, Callable, Iterator
 from src.models import (
     PromptAnalysis,
     PromptScore,
+    PromptView,
     Lesson,
     UserProgress,
     DemonstrationResult,
 )
 
 
-class IPromptEvaluator(ABC):
+class FastInterface(type):
+    """
+    Metaclass for interfaces that enforces @abstractmethod without ABCMeta.
+    
+    CPython refuses to instantiate any class whose __abstractmethods__ is
+    non-empty, so computing that set here is enough. Unlike ABCMeta, no
+    __instancecheck__/__subclasscheck__ hooks are installed, so isinstance()
+    against an interface takes the builtin fast path. Virtual subclasses
+    via register() are not supported.
+    """
+    
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        
+        abstracts = {
+            attr for attr, value in namespace.items()
+            if getattr(value, "__isabstractmethod__", False)
+        }
+        # Inherited abstract methods stay abstract until overridden
+        for base in bases:
+            for attr in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, attr, None), "__isabstractmethod__", False):
+                    abstracts.add(attr)
+        
+        cls.__abstractmethods__ = frozenset(abstracts)
+        return cls
+
+
+class IPromptEvaluator(metaclass=FastInterface):
     """
     ISP: Focused interface for prompt evaluation.
     DIP: High-level modules depend on this abstraction.
@@ -39,9 +68,26 @@ class IPromptEvaluator(ABC):
             PromptAnalysis with score and feedback
         """
         pass
+    
+    def evaluate_batch(self, prompts: List[str]) -> List[PromptAnalysis]:
+        """
+        Analyze several prompts at once.
+        
+        Evaluators backed by a remote model can override this to score
+        the whole batch in one request. The default evaluates each
+        distinct prompt once.
+        
+        Args:
+            prompts: The prompt texts to evaluate
+            
+        Returns:
+            PromptAnalysis for each prompt, in the same order
+        """
+        analyses = {prompt: self.evaluate(prompt) for prompt in dict.fromkeys(prompts)}
+        return [analyses[prompt] for prompt in prompts]
 
 
-class IScoreStrategy(ABC):
+class IScoreStrategy(metaclass=FastInterface):
     """
     ISP: Focused on scoring only.
     OCP: Can add new strategies without changing evaluator.
@@ -67,9 +113,31 @@ class IScoreStrategy(ABC):
             PromptScore object with all scoring dimensions
         """
         pass
+    
+    def score_view(
+        self,
+        view: PromptView,
+        context: Optional[str] = None
+    ) -> PromptScore:
+        """
+        Calculate score for a prompt whose derived forms are already built.
+        
+        Strategies that lowercase or strip the prompt can override this to
+        reuse the view's copies. The default scores view.raw.
+        
+        Args:
+            view: PromptView of the prompt to score
+            context: Optional context for scoring
+            
+        Returns:
+            PromptScore object with all scoring dimensions
+        """
+        if context is None:
+            return self.calculate_score(view.raw)
+        return self.calculate_score(view.raw, context)
 
 
-class ILessonProvider(ABC):
+class ILessonProvider(metaclass=FastInterface):
     """
     ISP: Focused on lesson retrieval.
     DIP: LearningCoach depends on this, not concrete implementation.
@@ -121,7 +189,7 @@ class ILessonProvider(ABC):
         pass
 
 
-class IFeedbackProvider(ABC):
+class IFeedbackProvider(metaclass=FastInterface):
     """
     ISP: Focused on feedback generation.
     OCP: Can add new feedback styles.
@@ -144,7 +212,7 @@ class IFeedbackProvider(ABC):
         pass
 
 
-class IProgressPersister(ABC):
+class IProgressPersister(metaclass=FastInterface):
     """
     ISP: Focused on persistence only.
     DIP: Allows swapping storage backends.
@@ -180,7 +248,7 @@ class IProgressPersister(ABC):
         pass
 
 
-class IAIClient(ABC):
+class IAIClient(metaclass=FastInterface):
     """
     ISP: Minimal AI interaction interface.
     DIP: Allows mocking for tests, swapping providers.
@@ -210,6 +278,29 @@ class IAIClient(ABC):
         """
         pass
     
+    def stream_chat(
+        self, 
+        messages: List[Dict[str, str]], 
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Send chat messages and yield the response text as it arrives.
+        
+        Providers without a streaming API can rely on this default,
+        which yields the complete chat() response as a single chunk.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Additional parameters (model, temperature, etc.)
+            
+        Yields:
+            Successive pieces of the AI response text
+            
+        Raises:
+            Exception: If API call fails
+        """
+        yield self.chat(messages, **kwargs)
+    
     @abstractmethod
     def analyze_prompt_intent(self, prompt: str) -> Dict[str, Any]:
         """
@@ -233,7 +324,7 @@ class IAIClient(ABC):
         pass
 
 
-class IDemonstrator(ABC):
+class IDemonstrator(metaclass=FastInterface):
     """
     ISP: Focused on demonstrating prompt impact.
     DIP: Allows swapping between real API and simulated responses.
@@ -246,7 +337,8 @@ class IDemonstrator(ABC):
     def demonstrate(
         self,
         original_prompt: str,
-        improved_prompt: Optional[str] = None
+        improved_prompt: Optional[str] = None,
+        on_delta: Optional[Callable[[str, str], None]] = None
     ) -> DemonstrationResult:
         """
         Show the difference between bad and good prompt responses.
@@ -254,6 +346,8 @@ class IDemonstrator(ABC):
         Args:
             original_prompt: The user's original prompt
             improved_prompt: Optional improved version (auto-generated if None)
+            on_delta: Optional callback receiving (side, text) as live
+                     responses stream in; side is "bad" or "good"
             
         Returns:
             DemonstrationResult with both responses and explanation
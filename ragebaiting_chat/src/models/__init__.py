@@ -2,6 +2,7 @@
 
 from src.models.prompt_models import (
     PromptIntent,
+    PromptView,
     PromptScore,
     PromptAnalysis,
     Exercise,
@@ -9,7 +10,9 @@ from src.models.prompt_models import (
     UserProgress,
     CoachConfig,
     ScoreWeights,
+    DEFAULT_WEIGHTS,
     DemonstrationResult,
+    PROMPT_HISTORY_LIMIT,
 )
 
 from src.models.ragebait_models import (
@@ -25,6 +28,7 @@ from src.models.ragebait_models import (
 __all__ = [
     # Original models (keeping for backward compatibility)
     'PromptIntent',
+    'PromptView',
     'PromptScore',
     'PromptAnalysis',
     'Exercise',
@@ -32,7 +36,9 @@ __all__ = [
     'UserProgress',
     'CoachConfig',
     'ScoreWeights',
+    'DEFAULT_WEIGHTS',
     'DemonstrationResult',
+    'PROMPT_HISTORY_LIMIT',
     # New ragebait models
     'EmotionalState',
     'RageIndicator',
@@ -5,12 +5,21 @@ This module defines the core data structures used throughout the application,
 following the Single Responsibility Principle (SRP).
 """
 
+from collections import deque
 from dataclasses import dataclass, field
+from math import isclose
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Deque, List, Optional, Dict, Any, Sequence
 from enum import Enum
 
 
+# Maximum number of analyses kept in UserProgress.prompt_history
+PROMPT_HISTORY_LIMIT = 100
+
+# Default scoring weights (learning orientation, specificity, engagement)
+DEFAULT_WEIGHT_VALUES = (0.4, 0.3, 0.3)
+
+
 class PromptIntent(Enum):
     """
     Types of prompt intents.
@@ -24,7 +33,39 @@ class PromptIntent(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
+class PromptView:
+    """
+    SRP: Only holds derived forms of one prompt.
+    Computed once per evaluation so scorers and analyzers share the same
+    lowercased and stripped copies instead of rebuilding them per check.
+    
+    Attributes:
+        raw: The prompt as entered
+        lower: raw.lower()
+        stripped: raw.strip()
+        length: len(raw)
+    """
+    raw: str
+    lower: str
+    stripped: str
+    length: int
+    
+    @classmethod
+    def of(cls, prompt: str) -> "PromptView":
+        """
+        Build a view of a prompt.
+        
+        Args:
+            prompt: The prompt text
+            
+        Returns:
+            PromptView for the prompt
+        """
+        return cls(prompt, prompt.lower(), prompt.strip(), len(prompt))
+
+
+@dataclass(slots=True, frozen=True)
 class PromptScore:
     """
     SRP: Only represents score data.
@@ -45,10 +86,17 @@ class PromptScore:
     
     def __post_init__(self):
         """Validate score ranges."""
-        for score_name in ['total_score', 'learning_orientation', 'specificity', 'engagement']:
-            score = getattr(self, score_name)
-            if not 0 <= score <= 100:
-                raise ValueError(f"{score_name} must be between 0 and 100, got {score}")
+        # Unrolled: this runs for every scored prompt
+        if not 0 <= self.total_score <= 100:
+            raise ValueError(f"total_score must be between 0 and 100, got {self.total_score}")
+        if not 0 <= self.learning_orientation <= 100:
+            raise ValueError(
+                f"learning_orientation must be between 0 and 100, got {self.learning_orientation}"
+            )
+        if not 0 <= self.specificity <= 100:
+            raise ValueError(f"specificity must be between 0 and 100, got {self.specificity}")
+        if not 0 <= self.engagement <= 100:
+            raise ValueError(f"engagement must be between 0 and 100, got {self.engagement}")
     
     @property
     def is_passing(self) -> bool:
@@ -56,29 +104,32 @@ class PromptScore:
         return self.total_score >= 60.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptAnalysis:
     """
     SRP: Complete analysis results.
     Contains score + detailed feedback.
     
+    Frozen, and PromptAnalyzer fills it with tuples, so cached analyses can
+    be handed to every caller without being changed by one of them.
+    
     Attributes:
         prompt: The original prompt text
         score: The calculated score
-        strengths: List of what the user did well
-        improvements: List of suggestions for improvement
-        examples: List of better alternative prompts
-        detected_patterns: List of anti-patterns found
+        strengths: What the user did well
+        improvements: Suggestions for improvement (may be a shared empty tuple)
+        examples: Better alternative prompts (may be a shared empty tuple)
+        detected_patterns: Anti-patterns found
     """
     prompt: str
     score: PromptScore
-    strengths: List[str]
-    improvements: List[str]
-    examples: List[str]
-    detected_patterns: List[str]
+    strengths: Sequence[str]
+    improvements: Sequence[str]
+    examples: Sequence[str]
+    detected_patterns: Sequence[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Exercise:
     """
     Practice exercise within a lesson.
@@ -99,7 +150,7 @@ class Exercise:
     bad_example: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Lesson:
     """
     SRP: Lesson content only.
@@ -128,7 +179,7 @@ class Lesson:
             raise ValueError(f"Difficulty must be between 1 and 5, got {self.difficulty}")
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProgress:
     """
     SRP: User state tracking only.
@@ -137,7 +188,8 @@ class UserProgress:
         user_id: Unique user identifier
         current_lesson: Current lesson number
         completed_lessons: List of completed lesson IDs
-        prompt_history: History of analyzed prompts
+        prompt_history: Most recent analyzed prompts (oldest dropped
+            beyond PROMPT_HISTORY_LIMIT)
         skill_level: User's skill level 1-5
         total_prompts: Total number of prompts submitted
         good_prompts: Number of prompts with score >= 60
@@ -145,15 +197,44 @@ class UserProgress:
     user_id: str
     current_lesson: int
     completed_lessons: List[str]
-    prompt_history: List[PromptAnalysis]
+    prompt_history: Deque[PromptAnalysis]
     skill_level: int
     total_prompts: int
     good_prompts: int
     
     def __post_init__(self):
-        """Validate skill level."""
+        """Validate skill level and bound the prompt history."""
         if not 1 <= self.skill_level <= 5:
             raise ValueError(f"Skill level must be between 1 and 5, got {self.skill_level}")
+        self.prompt_history = deque(self.prompt_history, maxlen=PROMPT_HISTORY_LIMIT)
+    
+    def record_prompt(self, analysis: PromptAnalysis) -> None:
+        """
+        Record an analyzed prompt in the counters and history.
+        
+        Args:
+            analysis: The analysis of the submitted prompt
+        """
+        self.total_prompts += 1
+        if analysis.score.is_passing:
+            self.good_prompts += 1
+        self.prompt_history.append(analysis)
+    
+    def replace_history(self, analyses: Sequence[PromptAnalysis]) -> None:
+        """
+        Swap in re-scored analyses for the history and update good_prompts.
+        
+        good_prompts moves by the change in passing entries, so prompts
+        already dropped from the history keep their original verdict.
+        
+        Args:
+            analyses: New analysis for each history entry, in the same order
+        """
+        old_passing = sum(analysis.score.is_passing for analysis in self.prompt_history)
+        new_passing = sum(analysis.score.is_passing for analysis in analyses)
+        self.prompt_history.clear()
+        self.prompt_history.extend(analyses)
+        self.good_prompts += new_passing - old_passing
     
     @property
     def success_rate(self) -> float:
@@ -163,7 +244,7 @@ class UserProgress:
         return (self.good_prompts / self.total_prompts) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class CoachConfig:
     """
     SRP: Configuration data only.
@@ -192,29 +273,39 @@ class CoachConfig:
             raise ValueError(f"feedback_style must be one of {valid_styles}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoreWeights:
     """
     SRP: Scoring configuration.
     OCP: Can add new weights without changing scoring logic.
     
+    Frozen, so one instance (like DEFAULT_WEIGHTS) can be shared by every
+    scorer; to change weights, assign a new ScoreWeights.
+    
     Attributes:
         learning_orientation: Weight for learning orientation (0-1)
         specificity: Weight for specificity (0-1)
         engagement: Weight for engagement (0-1)
     """
-    learning_orientation: float = 0.4
-    specificity: float = 0.3
-    engagement: float = 0.3
+    learning_orientation: float = DEFAULT_WEIGHT_VALUES[0]
+    specificity: float = DEFAULT_WEIGHT_VALUES[1]
+    engagement: float = DEFAULT_WEIGHT_VALUES[2]
     
     def __post_init__(self):
         """Validate weights sum to 1.0."""
+        if (self.learning_orientation, self.specificity, self.engagement) == DEFAULT_WEIGHT_VALUES:
+            return
+        
         total = self.learning_orientation + self.specificity + self.engagement
-        if not 0.99 <= total <= 1.01:  # Allow for floating point precision
+        if not isclose(total, 1.0, abs_tol=0.01):  # Allow for floating point precision
             raise ValueError(f"Weights must sum to 1.0, got {total}")
 
 
-@dataclass
+# Shared default weights; reuse instead of constructing ScoreWeights()
+DEFAULT_WEIGHTS = ScoreWeights()
+
+
+@dataclass(slots=True)
 class DemonstrationResult:
     """
     SRP: Holds demonstration comparison data.
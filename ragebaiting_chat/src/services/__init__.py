@@ -1,11 +1,30 @@
-"""Services package."""
+"""Services package.
 
-from src.services.score_strategies import RubricScorer
-from src.services.prompt_analyzer import PromptAnalyzer
-from src.services.feedback_generator import FeedbackGenerator
-from src.services.lesson_manager import LessonManager
-from src.services.prompt_demonstrator import PromptDemonstrator
-from src.services.antagonistic_services import FrustrationAnalyzer, OppositeDoer
+Services are imported on first access (PEP 562), so importing one service
+does not load the modules and dependencies of all the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.services.score_strategies import RubricScorer
+    from src.services.prompt_analyzer import PromptAnalyzer
+    from src.services.feedback_generator import FeedbackGenerator
+    from src.services.lesson_manager import LessonManager
+    from src.services.prompt_demonstrator import PromptDemonstrator
+    from src.services.antagonistic_services import FrustrationAnalyzer, OppositeDoer
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "RubricScorer": "src.services.score_strategies",
+    "PromptAnalyzer": "src.services.prompt_analyzer",
+    "FeedbackGenerator": "src.services.feedback_generator",
+    "LessonManager": "src.services.lesson_manager",
+    "PromptDemonstrator": "src.services.prompt_demonstrator",
+    "FrustrationAnalyzer": "src.services.antagonistic_services",
+    "OppositeDoer": "src.services.antagonistic_services",
+}
 
 __all__ = [
     "RubricScorer",
@@ -15,4 +34,19 @@ __all__ = [
     "PromptDemonstrator",
     "FrustrationAnalyzer",
     "OppositeDoer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a service on first access and cache it on the package."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily imported services alongside loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -10,13 +10,35 @@ Demonstrates:
 - LSP: Implements IFeedbackProvider interface
 """
 
-from typing import Literal
+import threading
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 from src.interfaces import IFeedbackProvider
-from src.models import PromptAnalysis
+from src.models import PromptAnalysis, PromptIntent
 
 
 FeedbackStyle = Literal["encouraging", "direct", "socratic"]
 
+# Line prefixes for listed items
+BULLET = "  • "
+CHECK = "  ✓ "
+
+# Score report opening the direct feedback style
+DIRECT_HEADER = (
+    "Prompt Score: {score.total_score:.0f}/100\n"
+    "  - Learning Orientation: {score.learning_orientation:.0f}/100\n"
+    "  - Specificity: {score.specificity:.0f}/100\n"
+    "  - Engagement: {score.engagement:.0f}/100\n"
+    "  - Intent: {score.intent.value}"
+)
+
+# Number of generated feedback strings kept per generator
+FEEDBACK_CACHE_SIZE = 128
+
+
+def numbered(items: List[str]) -> List[str]:
+    """Prefix items with 1-based list numbers."""
+    return [f"{i}. {item}" for i, item in enumerate(items, 1)]
+
 
 class FeedbackGenerator(IFeedbackProvider):
     """
@@ -35,25 +57,79 @@ class FeedbackGenerator(IFeedbackProvider):
         Args:
             style: The feedback style to use (encouraging, direct, or socratic)
         """
-        valid_styles = ["encouraging", "direct", "socratic"]
-        self.style = style if style in valid_styles else "encouraging"
+        self._dispatch = {
+            "encouraging": self._generate_encouraging_feedback,
+            "direct": self._generate_direct_feedback,
+            "socratic": self._generate_socratic_feedback,
+        }
+        self.style = style
+        self._cache: Dict[Tuple, str] = {}
+        self._cache_lock = threading.Lock()
+    
+    @property
+    def style(self) -> FeedbackStyle:
+        """The default feedback style."""
+        return self._active[0]
     
-    def generate_feedback(self, analysis: PromptAnalysis) -> str:
+    @style.setter
+    def style(self, style: FeedbackStyle) -> None:
+        """Select a style, defaulting to encouraging if it is unknown."""
+        # Style and generator are swapped together, so a concurrent
+        # generate_feedback never pairs one style with the other's text
+        self._active = self._resolve(style)
+    
+    def _resolve(self, style: str) -> Tuple[str, Callable[[PromptAnalysis], str]]:
+        """Bind a style to its generator, defaulting to encouraging if unknown."""
+        if style not in self._dispatch:
+            style = "encouraging"
+        return style, self._dispatch[style]
+    
+    def generate_feedback(
+        self,
+        analysis: PromptAnalysis,
+        style: Optional[FeedbackStyle] = None
+    ) -> str:
         """
         Generate feedback based on prompt analysis.
         
         Args:
             analysis: The prompt analysis results
+            style: Style for this call only; pass it instead of setting
+                   .style when the generator is shared between users
             
         Returns:
             Formatted feedback string
         """
-        if self.style == "encouraging":
-            return self._generate_encouraging_feedback(analysis)
-        elif self.style == "direct":
-            return self._generate_direct_feedback(analysis)
-        else:  # socratic
-            return self._generate_socratic_feedback(analysis)
+        style, impl = self._active if style is None else self._resolve(style)
+        key = (style, self._cache_key(analysis))
+        with self._cache_lock:
+            feedback = self._cache.get(key)
+        if feedback is not None:
+            return feedback
+        
+        feedback = impl(analysis)
+        
+        with self._cache_lock:
+            self._cache[key] = feedback
+            # Evict the oldest entries first
+            while len(self._cache) > FEEDBACK_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+        return feedback
+    
+    def _cache_key(self, analysis: PromptAnalysis) -> Tuple:
+        """Build a hashable key from every analysis field feedback reads."""
+        score = analysis.score
+        return (
+            score.total_score,
+            score.learning_orientation,
+            score.specificity,
+            score.engagement,
+            score.intent,
+            tuple(analysis.strengths),
+            tuple(analysis.improvements),
+            tuple(analysis.examples),
+            tuple(analysis.detected_patterns),
+        )
     
     def _generate_encouraging_feedback(self, analysis: PromptAnalysis) -> str:
         """Generate encouraging, positive feedback."""
@@ -71,26 +147,23 @@ class FeedbackGenerator(IFeedbackProvider):
         # Strengths
         if analysis.strengths:
             parts.append("\n✨ What you did well:")
-            for strength in analysis.strengths:
-                parts.append(f"  • {strength}")
+            parts.extend([BULLET + strength for strength in analysis.strengths])
         
         # Anti-patterns (if any)
         if analysis.detected_patterns:
             parts.append("\n⚠️  Patterns to avoid:")
-            for pattern in analysis.detected_patterns:
-                parts.append(f"  • {pattern}")
+            parts.extend([BULLET + pattern for pattern in analysis.detected_patterns])
         
         # Improvements
         if analysis.improvements:
             parts.append("\n💡 Ways to improve:")
-            for improvement in analysis.improvements:
-                parts.append(f"  • {improvement}")
+            parts.extend([BULLET + improvement for improvement in analysis.improvements])
         
         # Examples
         if analysis.examples:
             parts.append("\n📝 Try these instead:")
-            for example in analysis.examples[:2]:  # Limit to 2 examples
-                parts.append(f"  • {example}")
+            # Limit to 2 examples
+            parts.extend([BULLET + example for example in analysis.examples[:2]])
         
         # Closing encouragement
         if score.total_score >= 60:
@@ -102,15 +175,10 @@ class FeedbackGenerator(IFeedbackProvider):
     
     def _generate_direct_feedback(self, analysis: PromptAnalysis) -> str:
         """Generate direct, factual feedback."""
-        parts = []
         score = analysis.score
         
         # Score report
-        parts.append(f"Prompt Score: {score.total_score:.0f}/100")
-        parts.append(f"  - Learning Orientation: {score.learning_orientation:.0f}/100")
-        parts.append(f"  - Specificity: {score.specificity:.0f}/100")
-        parts.append(f"  - Engagement: {score.engagement:.0f}/100")
-        parts.append(f"  - Intent: {score.intent.value}")
+        parts = [DIRECT_HEADER.format(score=score)]
         
         # Status
         if score.is_passing:
@@ -121,26 +189,22 @@ class FeedbackGenerator(IFeedbackProvider):
         # Detected issues
         if analysis.detected_patterns:
             parts.append("\nDetected Issues:")
-            for i, pattern in enumerate(analysis.detected_patterns, 1):
-                parts.append(f"{i}. {pattern}")
+            parts.extend(numbered(analysis.detected_patterns))
         
         # Strengths
         if analysis.strengths:
             parts.append("\nStrengths:")
-            for i, strength in enumerate(analysis.strengths, 1):
-                parts.append(f"{i}. {strength}")
+            parts.extend(numbered(analysis.strengths))
         
         # Required improvements
         if analysis.improvements:
             parts.append("\nRequired Improvements:")
-            for i, improvement in enumerate(analysis.improvements, 1):
-                parts.append(f"{i}. {improvement}")
+            parts.extend(numbered(analysis.improvements))
         
         # Examples
         if analysis.examples:
             parts.append("\nBetter Alternatives:")
-            for example in analysis.examples[:3]:
-                parts.append(f"  {example}")
+            parts.extend(["  " + example for example in analysis.examples[:3]])
         
         return "\n".join(parts)
     
@@ -153,15 +217,14 @@ class FeedbackGenerator(IFeedbackProvider):
         parts.append(f"Your prompt scored {score.total_score:.0f}/100. Let's reflect on this together.\n")
         
         # Questions about intent
-        if score.intent.value == "do_it_for_me":
+        if score.intent is PromptIntent.DO_IT_FOR_ME:
             parts.append("🤔 Consider this: Are you asking the AI to do your work, or to help you learn?")
             parts.append("What would happen if you asked for guidance instead of a complete solution?\n")
         
         # Questions about strengths
         if analysis.strengths:
             parts.append("What you did well:")
-            for strength in analysis.strengths:
-                parts.append(f"  ✓ {strength}")
+            parts.extend([CHECK + strength for strength in analysis.strengths])
             parts.append("\nHow can you build on these strengths in your next prompt?\n")
         
         # Questions about weaknesses
@@ -177,15 +240,13 @@ class FeedbackGenerator(IFeedbackProvider):
         # Reflective closing
         if analysis.detected_patterns:
             parts.append("\n⚠️  Patterns detected:")
-            for pattern in analysis.detected_patterns:
-                parts.append(f"  • {pattern}")
+            parts.extend([BULLET + pattern for pattern in analysis.detected_patterns])
             parts.append("\nWhat changes could address these patterns?")
         
         # Example questions
         if analysis.examples:
             parts.append("\n💭 Compare your prompt to these alternatives:")
-            for example in analysis.examples[:2]:
-                parts.append(f"  • {example}")
+            parts.extend([BULLET + example for example in analysis.examples[:2]])
             parts.append("\nWhat makes these examples more effective for learning?")
         
         return "\n".join(parts)
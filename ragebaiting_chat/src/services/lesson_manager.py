@@ -11,7 +11,7 @@ Demonstrates:
 - DIP: Returns abstractions (Lesson models) not implementation details
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from src.interfaces import ILessonProvider
 from src.models import Lesson, UserProgress
 
@@ -26,6 +26,9 @@ class LessonManager(ILessonProvider):
     def __init__(self):
         """Initialize lesson manager with empty lesson catalog."""
         self._lessons: Dict[str, Lesson] = {}
+        # difficulty -> lesson IDs, in catalog order
+        self._by_level: Dict[int, List[str]] = {}
+        self._sorted_lessons: Optional[Tuple[Lesson, ...]] = None
     
     def get_lesson(self, lesson_id: str) -> Optional[Lesson]:
         """
@@ -49,10 +52,8 @@ class LessonManager(ILessonProvider):
         Returns:
             List of lessons at the specified difficulty
         """
-        return [
-            lesson for lesson in self._lessons.values()
-            if lesson.difficulty == difficulty
-        ]
+        lessons = self._lessons
+        return [lessons[lesson_id] for lesson_id in self._by_level.get(difficulty, ())]
     
     def get_next_lesson(self, progress: UserProgress) -> Optional[Lesson]:
         """
@@ -66,29 +67,17 @@ class LessonManager(ILessonProvider):
         """
         # Determine appropriate difficulty level based on skill level (1-5)
         target_difficulty = progress.skill_level
+        completed = frozenset(progress.completed_lessons)
         
-        # Get lessons at appropriate difficulty
-        candidate_lessons = self.get_lessons_by_level(target_difficulty)
-        
-        # Filter out completed lessons
-        available_lessons = [
-            lesson for lesson in candidate_lessons
-            if lesson.id not in progress.completed_lessons
-        ]
-        
-        # Return first available lesson, or None if all completed
-        if available_lessons:
-            return available_lessons[0]
-        
-        # If all lessons at current level completed, try next level
+        # Return the first uncompleted lesson at the target level; if all of
+        # those are completed, try the next level up
+        levels = [target_difficulty]
         if target_difficulty < 5:
-            next_level_lessons = self.get_lessons_by_level(target_difficulty + 1)
-            next_available = [
-                lesson for lesson in next_level_lessons
-                if lesson.id not in progress.completed_lessons
-            ]
-            if next_available:
-                return next_available[0]
+            levels.append(target_difficulty + 1)
+        for level in levels:
+            for lesson_id in self._by_level.get(level, ()):
+                if lesson_id not in completed:
+                    return self._lessons[lesson_id]
         
         return None
     
@@ -99,7 +88,20 @@ class LessonManager(ILessonProvider):
         Args:
             lesson: The lesson to add
         """
+        previous = self._lessons.get(lesson.id)
         self._lessons[lesson.id] = lesson
+        self._sorted_lessons = None
+        
+        if previous is None:
+            self._by_level.setdefault(lesson.difficulty, []).append(lesson.id)
+        elif previous.difficulty != lesson.difficulty:
+            # An updated lesson keeps its catalog position, so rebuild the
+            # new bucket in catalog order rather than appending to it
+            self._by_level[previous.difficulty].remove(lesson.id)
+            self._by_level[lesson.difficulty] = [
+                lesson_id for lesson_id, existing in self._lessons.items()
+                if existing.difficulty == lesson.difficulty
+            ]
     
     def get_all_lessons(self) -> List[Lesson]:
         """
@@ -110,6 +112,22 @@ class LessonManager(ILessonProvider):
         """
         return list(self._lessons.values())
     
+    def get_all_lessons_sorted(self) -> Tuple[Lesson, ...]:
+        """
+        Get all lessons ordered by difficulty.
+        
+        The sorted catalog is cached until the next add_lesson call,
+        so repeated calls (e.g. on every UI rerun) skip the sort.
+        
+        Returns:
+            Tuple of all lessons, easiest first
+        """
+        if self._sorted_lessons is None:
+            self._sorted_lessons = tuple(
+                sorted(self._lessons.values(), key=lambda lesson: lesson.difficulty)
+            )
+        return self._sorted_lessons
+    
     def load_default_lessons(self) -> None:
         """
         Load default lesson catalog.
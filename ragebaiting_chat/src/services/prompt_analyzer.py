@@ -11,9 +11,75 @@ Demonstrates:
 - DIP: Depends on IScoreStrategy abstraction, not concrete implementation
 """
 
-from typing import List
+from itertools import product
+from typing import Dict, List, Sequence, Tuple
 from src.interfaces import IPromptEvaluator, IScoreStrategy
-from src.models import PromptAnalysis, PromptScore, PromptIntent
+from src.models import PromptAnalysis, PromptScore, PromptIntent, PromptView
+
+
+# Returned for passing prompts instead of allocating an empty list each time
+NO_SUGGESTIONS: Tuple[str, ...] = ()
+
+# Improvement suggestions
+IMPROVE_LEARNING = (
+    "Rephrase to focus on learning: Use 'explain', 'teach me', or 'help me understand' "
+    "instead of 'write', 'do', or 'give me'"
+)
+IMPROVE_SPECIFICITY = (
+    "Add more specific details: Include what topic, what aspect, "
+    "or what context you're interested in"
+)
+IMPROVE_LENGTH = (
+    "Expand your prompt: Provide more context and detail about what you want to learn"
+)
+IMPROVE_ENGAGEMENT = (
+    "Request interactive learning: Ask for quizzes, examples, or practice problems",
+    "Use multi-step prompts: For example, "
+    "'Explain X, then quiz me, then give me practice problems'",
+)
+IMPROVE_INTENT = (
+    "Shift from 'do it for me' to 'teach me how': Instead of asking AI to complete your work, "
+    "ask it to guide you through the process"
+)
+IMPROVE_GENERAL = (
+    "Example of a strong prompt: 'Explain how Python decorators work, provide examples, "
+    "then quiz me to check my understanding'"
+)
+
+# Example prompts for each weakness
+DO_IT_EXAMPLES = (
+    "Instead of 'Write my essay about climate change', try: "
+    "'Explain the key arguments about climate change, then help me organize my thoughts'",
+    "Instead of 'Do my homework', try: "
+    "'Teach me the concepts I need, then quiz me to verify my understanding'",
+)
+SPECIFICITY_EXAMPLES = (
+    "Instead of 'Help me with Python', try: "
+    "'Explain how Python list comprehensions work with examples'",
+    "Instead of 'Explain stuff', try: "
+    "'Explain the difference between stacks and queues, focusing on use cases'",
+)
+ENGAGEMENT_EXAMPLES = (
+    "Try adding: '...then quiz me to test my understanding'",
+    "Try adding: '...provide practice problems I can work through'",
+)
+GENERAL_EXAMPLES = (
+    "'Explain how recursion works in Python, provide examples with base cases, "
+    "then give me practice problems to solve'",
+)
+
+
+def _combine_examples(flags: Tuple[bool, bool, bool]) -> Tuple[str, ...]:
+    """Join the example groups whose weakness flag is set."""
+    groups = (DO_IT_EXAMPLES, SPECIFICITY_EXAMPLES, ENGAGEMENT_EXAMPLES)
+    examples = tuple(example for flag, group in zip(flags, groups) if flag for example in group)
+    return examples or GENERAL_EXAMPLES
+
+
+# (do-it-for-me, low specificity, low engagement) -> shared example tuple
+EXAMPLE_SETS: Dict[Tuple[bool, bool, bool], Tuple[str, ...]] = {
+    flags: _combine_examples(flags) for flags in product((False, True), repeat=3)
+}
 
 
 class PromptAnalyzer(IPromptEvaluator):
@@ -26,41 +92,44 @@ class PromptAnalyzer(IPromptEvaluator):
     
     # Anti-pattern keywords to detect
     ANTI_PATTERN_KEYWORDS = {
-        "do_it_for_me": [
+        "do_it_for_me": (
             "write my", "do my", "complete my", "solve for me",
             "give me the answer", "just tell me", "do it for me"
-        ],
-        "complete_solution": [
+        ),
+        "complete_solution": (
             "complete solution", "entire code", "full implementation",
             "all the code", "whole program"
-        ],
-        "vague": [
+        ),
+        "vague": (
             "stuff", "things", "help", "something", "anything"
-        ],
-        "passive": [
+        ),
+        "passive": (
             "i don't understand", "i'm confused", "i can't"
-        ]
+        )
     }
     
     # Strength keywords to identify
     STRENGTH_KEYWORDS = {
-        "learning_oriented": [
+        "learning_oriented": (
             "explain", "teach me", "help me understand", "show me how",
             "walk me through", "demonstrate"
-        ],
-        "specific": [
+        ),
+        "specific": (
             "specifically", "in particular", "focusing on", "regarding",
             "about", "concerning"
-        ],
-        "interactive": [
+        ),
+        "interactive": (
             "quiz me", "test my", "check my understanding", "give me practice",
             "challenge me", "then"
-        ],
-        "reflective": [
+        ),
+        "reflective": (
             "why", "how does", "what if", "difference between", "compare"
-        ]
+        )
     }
     
+    # Vague keywords match whole words, so look them up per token
+    VAGUE_WORDS = frozenset(ANTI_PATTERN_KEYWORDS["vague"])
+    
     def __init__(self, scorer: IScoreStrategy):
         """
         Initialize analyzer with a scoring strategy.
@@ -80,54 +149,62 @@ class PromptAnalyzer(IPromptEvaluator):
         Returns:
             PromptAnalysis with score, detected_patterns, strengths, and improvements
         """
+        # Lowercase and strip once for the scorer and every check below
+        view = PromptView.of(prompt)
+        
         # Get score from strategy
-        score = self.scorer.calculate_score(prompt)
+        score = self.scorer.score_view(view)
         
         # Detect anti-patterns
-        detected_patterns = self._detect_anti_patterns(prompt, score)
+        detected_patterns = self._detect_anti_patterns(view, score)
         
         # Identify strengths
-        strengths = self._identify_strengths(prompt, score)
+        strengths = self._identify_strengths(view, score)
         
         # Generate improvements
-        improvements = self._generate_improvements(prompt, score)
+        improvements = self._generate_improvements(view, score)
         
         # Generate example prompts
-        examples = self._generate_examples(prompt, score)
+        examples = self._generate_examples(view, score)
         
+        # Tuples, so the analysis (and the cached score it shares) stays immutable
         return PromptAnalysis(
             prompt=prompt,
             score=score,
-            strengths=strengths,
-            improvements=improvements,
-            examples=examples,
-            detected_patterns=detected_patterns
+            strengths=tuple(strengths),
+            improvements=tuple(improvements),
+            examples=tuple(examples),
+            detected_patterns=tuple(detected_patterns)
         )
     
-    def _detect_anti_patterns(self, prompt: str, score: PromptScore) -> List[str]:
+    def _detect_anti_patterns(self, view: PromptView, score: PromptScore) -> List[str]:
         """
         Detect anti-patterns in the prompt.
         
         Args:
-            prompt: The prompt to analyze
+            view: PromptView of the prompt to analyze
             score: The calculated score
             
         Returns:
             List of detected anti-pattern descriptions
         """
         patterns = []
-        prompt_lower = prompt.lower()
+        prompt_lower = view.lower
         
         # Empty or very short prompt
-        if len(prompt.strip()) == 0:
+        if len(view.stripped) == 0:
             patterns.append("Empty prompt - no question or request provided")
-        elif len(prompt.strip()) < 10:
+        elif len(view.stripped) < 10:
             patterns.append("Very short prompt - lacks sufficient detail")
         
         # Check for "do it for me" intent
-        if score.intent == PromptIntent.DO_IT_FOR_ME:
+        if score.intent is PromptIntent.DO_IT_FOR_ME:
             patterns.append("Do-it-for-me pattern detected - asking AI to complete work instead of learning")
         
+        # No keyword can occur in a blank prompt
+        if not view.stripped:
+            return patterns
+        
         # Check for complete solution requests
         for keyword in self.ANTI_PATTERN_KEYWORDS["complete_solution"]:
             if keyword in prompt_lower:
@@ -135,9 +212,7 @@ class PromptAnalyzer(IPromptEvaluator):
                 break
         
         # Check for vague language
-        vague_count = sum(1 for keyword in self.ANTI_PATTERN_KEYWORDS["vague"] 
-                         if keyword in prompt_lower.split())
-        if vague_count > 0 and score.specificity < 50:
+        if score.specificity < 50 and not self.VAGUE_WORDS.isdisjoint(prompt_lower.split()):
             patterns.append("Vague language used - be more specific about what you want to learn")
         
         # Check for passive language
@@ -148,173 +223,130 @@ class PromptAnalyzer(IPromptEvaluator):
         
         return patterns
     
-    def _identify_strengths(self, prompt: str, score: PromptScore) -> List[str]:
+    def _identify_strengths(self, view: PromptView, score: PromptScore) -> List[str]:
         """
         Identify strengths in the prompt.
         
         Args:
-            prompt: The prompt to analyze
+            view: PromptView of the prompt to analyze
             score: The calculated score
             
         Returns:
             List of identified strength descriptions
         """
         strengths = []
-        prompt_lower = prompt.lower()
+        prompt_lower = view.lower
         
         # Learning orientation
         if score.learning_orientation >= 60:
-            learning_keywords_found = [kw for kw in self.STRENGTH_KEYWORDS["learning_oriented"] 
-                                      if kw in prompt_lower]
-            if learning_keywords_found:
-                strengths.append(f"Learning-oriented approach using '{learning_keywords_found[0]}'")
+            learning_keyword = next((kw for kw in self.STRENGTH_KEYWORDS["learning_oriented"] 
+                                     if kw in prompt_lower), None)
+            if learning_keyword:
+                strengths.append(f"Learning-oriented approach using '{learning_keyword}'")
         
         # Specificity
         if score.specificity >= 60:
-            specific_keywords_found = [kw for kw in self.STRENGTH_KEYWORDS["specific"] 
-                                      if kw in prompt_lower]
-            if specific_keywords_found:
+            specific_keyword = next((kw for kw in self.STRENGTH_KEYWORDS["specific"] 
+                                     if kw in prompt_lower), None)
+            if specific_keyword:
                 strengths.append(f"Specific and focused on particular topics")
-            elif len(prompt) >= 50:
+            elif view.length >= 50:
                 strengths.append("Good level of detail provided")
         
         # Interactive elements
         if score.engagement >= 60:
-            interactive_keywords_found = [kw for kw in self.STRENGTH_KEYWORDS["interactive"] 
-                                         if kw in prompt_lower]
-            if interactive_keywords_found:
-                strengths.append(f"Interactive learning requested ('{interactive_keywords_found[0]}')")
+            interactive_keyword = next((kw for kw in self.STRENGTH_KEYWORDS["interactive"] 
+                                        if kw in prompt_lower), None)
+            if interactive_keyword:
+                strengths.append(f"Interactive learning requested ('{interactive_keyword}')")
         
         # Reflective thinking
-        reflective_keywords_found = [kw for kw in self.STRENGTH_KEYWORDS["reflective"] 
-                                    if kw in prompt_lower]
-        if reflective_keywords_found:
-            strengths.append(f"Demonstrates reflective thinking with '{reflective_keywords_found[0]}'")
+        reflective_keyword = next((kw for kw in self.STRENGTH_KEYWORDS["reflective"] 
+                                   if kw in prompt_lower), None)
+        if reflective_keyword:
+            strengths.append(f"Demonstrates reflective thinking with '{reflective_keyword}'")
         
         # Multi-step approach
-        if "then" in prompt_lower or "," in prompt:
+        if "then" in prompt_lower or "," in view.raw:
             strengths.append("Multi-step learning approach")
         
         return strengths
     
-    def _generate_improvements(self, prompt: str, score: PromptScore) -> List[str]:
+    def _generate_improvements(self, view: PromptView, score: PromptScore) -> Sequence[str]:
         """
         Generate improvement suggestions based on score.
         
         Args:
-            prompt: The prompt to analyze
+            view: PromptView of the prompt to analyze
             score: The calculated score
             
         Returns:
-            List of improvement suggestions
+            Improvement suggestions; NO_SUGGESTIONS when none apply
         """
-        improvements = []
-        
         # Only suggest improvements if score is below passing
         if score.total_score >= 70:
-            return improvements
+            return NO_SUGGESTIONS
         
-        # Find the weakest dimension
-        dimensions = {
-            "learning_orientation": score.learning_orientation,
-            "specificity": score.specificity,
-            "engagement": score.engagement
-        }
+        learning = score.learning_orientation
+        specificity = score.specificity
+        engagement = score.engagement
         
-        weakest = min(dimensions, key=dimensions.get)
-        weakest_score = dimensions[weakest]
+        # With every dimension at 60+, only the intent guidance can apply
+        weakest_score = min(learning, specificity, engagement)
+        if weakest_score >= 60 and score.intent is not PromptIntent.DO_IT_FOR_ME:
+            return NO_SUGGESTIONS
+        
+        improvements = []
+        
+        # Find the weakest dimension (ties go to the earlier one)
+        if learning <= specificity and learning <= engagement:
+            weakest = "learning_orientation"
+        elif specificity <= engagement:
+            weakest = "specificity"
+        else:
+            weakest = "engagement"
         
         # Generate targeted improvements
         if weakest == "learning_orientation" and weakest_score < 60:
-            improvements.append(
-                "Rephrase to focus on learning: Use 'explain', 'teach me', or 'help me understand' "
-                "instead of 'write', 'do', or 'give me'"
-            )
+            improvements.append(IMPROVE_LEARNING)
         
         if weakest == "specificity" and weakest_score < 60:
-            improvements.append(
-                "Add more specific details: Include what topic, what aspect, or what context you're interested in"
-            )
-            if len(prompt.strip()) < 20:
-                improvements.append(
-                    "Expand your prompt: Provide more context and detail about what you want to learn"
-                )
+            improvements.append(IMPROVE_SPECIFICITY)
+            if len(view.stripped) < 20:
+                improvements.append(IMPROVE_LENGTH)
         
         if weakest == "engagement" and weakest_score < 60:
-            improvements.append(
-                "Request interactive learning: Ask for quizzes, examples, or practice problems"
-            )
-            improvements.append(
-                "Use multi-step prompts: For example, 'Explain X, then quiz me, then give me practice problems'"
-            )
+            improvements.extend(IMPROVE_ENGAGEMENT)
         
         # If intent is wrong, provide specific guidance
-        if score.intent == PromptIntent.DO_IT_FOR_ME:
-            improvements.append(
-                "Shift from 'do it for me' to 'teach me how': Instead of asking AI to complete your work, "
-                "ask it to guide you through the process"
-            )
+        if score.intent is PromptIntent.DO_IT_FOR_ME:
+            improvements.append(IMPROVE_INTENT)
         
         # If all dimensions are low, provide general guidance
-        if all(score < 50 for score in dimensions.values()):
-            improvements.append(
-                "Example of a strong prompt: 'Explain how Python decorators work, provide examples, "
-                "then quiz me to check my understanding'"
-            )
+        if max(learning, specificity, engagement) < 50:
+            improvements.append(IMPROVE_GENERAL)
         
         return improvements
     
-    def _generate_examples(self, prompt: str, score: PromptScore) -> List[str]:
+    def _generate_examples(self, view: PromptView, score: PromptScore) -> Sequence[str]:
         """
         Generate example better prompts based on weaknesses.
         
         Args:
-            prompt: The original prompt
+            view: PromptView of the original prompt
             score: The calculated score
             
         Returns:
-            List of example improved prompts
+            Example improved prompts; NO_SUGGESTIONS for passing prompts
         """
-        examples = []
-        
         # Only generate examples if score is below passing
         if score.total_score >= 70:
-            return examples
-        
-        # Generate examples based on intent and weaknesses
-        if score.intent == PromptIntent.DO_IT_FOR_ME:
-            examples.append(
-                "Instead of 'Write my essay about climate change', try: "
-                "'Explain the key arguments about climate change, then help me organize my thoughts'"
-            )
-            examples.append(
-                "Instead of 'Do my homework', try: "
-                "'Teach me the concepts I need, then quiz me to verify my understanding'"
-            )
-        
-        if score.specificity < 50:
-            examples.append(
-                "Instead of 'Help me with Python', try: "
-                "'Explain how Python list comprehensions work with examples'"
-            )
-            examples.append(
-                "Instead of 'Explain stuff', try: "
-                "'Explain the difference between stacks and queues, focusing on use cases'"
-            )
-        
-        if score.engagement < 50:
-            examples.append(
-                "Try adding: '...then quiz me to test my understanding'"
-            )
-            examples.append(
-                "Try adding: '...provide practice problems I can work through'"
-            )
-        
-        # Provide general strong example if no specific examples added
-        if not examples:
-            examples.append(
-                "'Explain how recursion works in Python, provide examples with base cases, "
-                "then give me practice problems to solve'"
-            )
-        
-        return examples
+            return NO_SUGGESTIONS
+        
+        # Examples depend only on intent and weaknesses, so each of the
+        # eight combinations is a prebuilt tuple
+        return EXAMPLE_SETS[(
+            score.intent is PromptIntent.DO_IT_FOR_ME,
+            score.specificity < 50,
+            score.engagement < 50,
+        )]
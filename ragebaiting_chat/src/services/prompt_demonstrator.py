@@ -5,7 +5,11 @@ Demonstrates the impact of good vs bad prompts through actual AI responses.
 Follows SRP and DIP principles.
 """
 
-from typing import Optional, Dict
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Tuple
 from src.interfaces import IDemonstrator, IAIClient
 from src.models import DemonstrationResult, PromptIntent
 
@@ -101,6 +105,30 @@ The improved version gets immediate, relevant help.""",
 }
 
 
+BAD_RESPONSE_SYSTEM_PROMPT = """You are an AI assistant that gives minimal, unhelpful responses.
+Your goal is to demonstrate BAD AI behavior:
+- Give direct answers without explanation
+- Don't check understanding
+- Don't encourage practice
+- Be brief and generic
+- Just provide what's asked, nothing more"""
+
+
+GOOD_RESPONSE_SYSTEM_PROMPT = """You are an excellent AI learning coach. Your goal is to:
+- Explain concepts clearly with examples
+- Check understanding with questions
+- Encourage hands-on practice
+- Provide feedback opportunities
+- Be engaging and supportive
+Focus on teaching, not just answering."""
+
+
+# Default completion settings for each side of the demonstration. Tight
+# token limits and low temperatures keep responses short and repeatable.
+BAD_RESPONSE_OPTIONS: Dict[str, Any] = {"max_tokens": 200, "temperature": 0.2, "stop": ["\n\n\n"]}
+GOOD_RESPONSE_OPTIONS: Dict[str, Any] = {"max_tokens": 500, "temperature": 0.3}
+
+
 class PromptDemonstrator(IDemonstrator):
     """
     SRP: Focuses only on demonstrating prompt impact.
@@ -112,32 +140,55 @@ class PromptDemonstrator(IDemonstrator):
     Falls back to simulated responses if API is unavailable.
     """
     
-    def __init__(self, ai_client: Optional[IAIClient] = None):
+    def __init__(
+        self,
+        ai_client: Optional[IAIClient] = None,
+        response_cache: Optional[MutableMapping[str, Dict[str, str]]] = None,
+        bad_response_options: Optional[Dict[str, Any]] = None,
+        good_response_options: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize demonstrator with optional AI client.
         
         Args:
             ai_client: Optional AI client for real API calls.
                       If None, uses simulated responses.
+            response_cache: Optional mapping that stores live responses per
+                           prompt pair, so repeat demonstrations skip the API.
+            bad_response_options: Completion options for the bad response.
+                                 Defaults to BAD_RESPONSE_OPTIONS.
+            good_response_options: Completion options for the good response.
+                                  Defaults to GOOD_RESPONSE_OPTIONS.
         """
         self.ai_client = ai_client
+        self.response_cache = response_cache
+        self.bad_response_options = dict(
+            BAD_RESPONSE_OPTIONS if bad_response_options is None else bad_response_options
+        )
+        self.good_response_options = dict(
+            GOOD_RESPONSE_OPTIONS if good_response_options is None else good_response_options
+        )
     
     def demonstrate(
         self,
         original_prompt: str,
-        improved_prompt: Optional[str] = None
+        improved_prompt: Optional[str] = None,
+        on_delta: Optional[Callable[[str, str], None]] = None
     ) -> DemonstrationResult:
         """
         Show the difference between bad and good prompt responses.
         
         Strategy:
-        1. If AI client available: Send both prompts to AI with different system prompts
+        1. If AI client available: Send both prompts to AI concurrently with different system prompts
         2. If no AI client: Use simulated responses based on detected patterns
         3. Generate explanation of why improved version is better
         
         Args:
             original_prompt: The user's original prompt
             improved_prompt: Optional improved version (auto-generated if None)
+            on_delta: Optional callback receiving (side, text) as live responses
+                     stream in; side is "bad" or "good". Always called on the
+                     calling thread, so it may update UI elements.
             
         Returns:
             DemonstrationResult with both responses and explanation
@@ -152,8 +203,9 @@ class PromptDemonstrator(IDemonstrator):
         # Get responses (real or simulated)
         if self.ai_client:
             try:
-                bad_response = self._get_bad_response(original_prompt)
-                good_response = self._get_good_response(improved_prompt)
+                bad_response, good_response = self._get_cached_or_live_responses(
+                    original_prompt, improved_prompt, on_delta
+                )
                 is_simulated = False
             except Exception:
                 # Fallback to simulated if API fails
@@ -238,47 +290,111 @@ I want to understand why [specific thing] happens so I can apply it correctly.""
         
         return improvements.get(pattern, original)
     
-    def _get_bad_response(self, prompt: str) -> str:
-        """Get intentionally unhelpful response from AI."""
-        messages = [
-            {
-                "role": "system",
-                "content": """You are an AI assistant that gives minimal, unhelpful responses.
-Your goal is to demonstrate BAD AI behavior:
-- Give direct answers without explanation
-- Don't check understanding
-- Don't encourage practice
-- Be brief and generic
-- Just provide what's asked, nothing more"""
-            },
-            {
-                "role": "user",
-                "content": prompt
+    def _get_cached_or_live_responses(
+        self,
+        original_prompt: str,
+        improved_prompt: str,
+        on_delta: Optional[Callable[[str, str], None]]
+    ) -> Tuple[str, str]:
+        """Reuse cached live responses for a prompt pair, fetching them on a miss."""
+        cache_key = self._cache_key(original_prompt, improved_prompt)
+        
+        if self.response_cache is not None and cache_key in self.response_cache:
+            cached = self.response_cache[cache_key]
+            return cached["bad_response"], cached["good_response"]
+        
+        if on_delta is None:
+            bad_response, good_response = self._get_live_responses(original_prompt, improved_prompt)
+        else:
+            bad_response, good_response = self._stream_live_responses(
+                original_prompt, improved_prompt, on_delta
+            )
+        
+        if self.response_cache is not None:
+            self.response_cache[cache_key] = {
+                "bad_response": bad_response,
+                "good_response": good_response
             }
-        ]
         
-        return self.ai_client.chat(messages, max_tokens=200, temperature=0.3)
+        return bad_response, good_response
+    
+    def _cache_key(self, original_prompt: str, improved_prompt: str) -> str:
+        """Build a stable cache key for a prompt pair and the completion options."""
+        payload = json.dumps(
+            [original_prompt, improved_prompt, self.bad_response_options, self.good_response_options],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _get_live_responses(self, original_prompt: str, improved_prompt: str) -> Tuple[str, str]:
+        """
+        Fetch the bad and good responses concurrently.
+        
+        Both calls are network-bound, so running them side by side makes the
+        demonstration take about as long as the slower call, not the sum.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bad_future = executor.submit(self._get_bad_response, original_prompt)
+            good_future = executor.submit(self._get_good_response, improved_prompt)
+            return bad_future.result(), good_future.result()
+    
+    def _stream_live_responses(
+        self,
+        original_prompt: str,
+        improved_prompt: str,
+        on_delta: Callable[[str, str], None]
+    ) -> Tuple[str, str]:
+        """
+        Stream the bad and good responses concurrently.
+        
+        Worker threads only queue the incoming text; on_delta is invoked
+        here on the calling thread as each piece arrives.
+        """
+        deltas: Queue = Queue()
+        
+        def pump(side: str, messages: List[Dict[str, str]], options: Dict[str, Any]) -> str:
+            chunks = []
+            for chunk in self.ai_client.stream_chat(messages, **options):
+                chunks.append(chunk)
+                deltas.put((side, chunk))
+            return "".join(chunks)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bad_future = executor.submit(
+                pump, "bad", self._build_messages(BAD_RESPONSE_SYSTEM_PROMPT, original_prompt),
+                self.bad_response_options
+            )
+            good_future = executor.submit(
+                pump, "good", self._build_messages(GOOD_RESPONSE_SYSTEM_PROMPT, improved_prompt),
+                self.good_response_options
+            )
+            futures = (bad_future, good_future)
+            
+            while not all(future.done() for future in futures) or not deltas.empty():
+                try:
+                    side, chunk = deltas.get(timeout=0.05)
+                except Empty:
+                    continue
+                on_delta(side, chunk)
+            
+            return bad_future.result(), good_future.result()
+    
+    def _build_messages(self, system_prompt: str, prompt: str) -> List[Dict[str, str]]:
+        """Build the chat messages for one side of the demonstration."""
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _get_bad_response(self, prompt: str) -> str:
+        """Get intentionally unhelpful response from AI."""
+        messages = self._build_messages(BAD_RESPONSE_SYSTEM_PROMPT, prompt)
+        return self.ai_client.chat(messages, **self.bad_response_options)
     
     def _get_good_response(self, prompt: str) -> str:
         """Get helpful, educational response from AI."""
-        messages = [
-            {
-                "role": "system",
-                "content": """You are an excellent AI learning coach. Your goal is to:
-- Explain concepts clearly with examples
-- Check understanding with questions
-- Encourage hands-on practice
-- Provide feedback opportunities
-- Be engaging and supportive
-Focus on teaching, not just answering."""
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-        
-        return self.ai_client.chat(messages, max_tokens=400, temperature=0.7)
+        messages = self._build_messages(GOOD_RESPONSE_SYSTEM_PROMPT, prompt)
+        return self.ai_client.chat(messages, **self.good_response_options)
     
     def _get_simulated_bad_response(self, pattern: str) -> str:
         """Get simulated unhelpful response based on pattern."""
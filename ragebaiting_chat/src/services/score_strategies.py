@@ -7,9 +7,18 @@ Following:
 - Liskov Substitution Principle (LSP): All strategies are interchangeable
 """
 
-from typing import Optional
+import threading
+from math import isclose
+from typing import Dict, Optional, Tuple
 from src.interfaces import IScoreStrategy
-from src.models import PromptScore, PromptIntent, ScoreWeights
+from src.models import PromptScore, PromptIntent, PromptView, ScoreWeights, DEFAULT_WEIGHTS
+
+
+# Scores kept per scorer; repeated prompts (retries, reruns) skip the rubric
+SCORE_CACHE_SIZE = 1024
+
+# Accumulator slots used by RubricScorer.SCORE_TABLE
+LEARNING, SPECIFICITY, ENGAGEMENT, STEPS = range(4)
 
 
 class RubricScorer(IScoreStrategy):
@@ -21,6 +30,76 @@ class RubricScorer(IScoreStrategy):
     Fast, predictable, no API calls needed.
     """
     
+    # Learning keywords (add points)
+    LEARNING_KEYWORDS = (
+        "explain", "teach", "help me understand", 
+        "why", "how does", "can you show me",
+        "walk me through", "break down", "clarify",
+        "guide me", "help me learn"
+    )
+    
+    # Anti-learning keywords (subtract points)
+    ANTI_LEARNING_KEYWORDS = (
+        "write my", "do my", "give me the answer",
+        "solve this for me", "just tell me", "complete this"
+    )
+    
+    # Context words indicate specificity
+    CONTEXT_WORDS = (
+        "because", "specifically", "in the context of",
+        "for example", "such as", "regarding"
+    )
+    
+    # Vague words reduce specificity
+    VAGUE_WORDS = ("something", "anything", "stuff", "things")
+    
+    # Interactive keywords
+    ENGAGEMENT_KEYWORDS = (
+        "quiz me", "test my understanding", "ask me questions",
+        "practice", "exercise", "check if", "verify",
+        "challenge me", "give me problems", "let me try"
+    )
+    
+    # Passive keywords (reduce engagement)
+    PASSIVE_KEYWORDS = (
+        "just tell me", "just give me", "simply explain"
+    )
+    
+    # Multiple steps indicate engagement
+    STEP_INDICATORS = ("then", "after that", "next", "finally")
+    
+    # Intent patterns, checked in this order
+    INTENT_PATTERNS = {
+        PromptIntent.DO_IT_FOR_ME: (
+            "write my", "do my", "solve this for me",
+            "complete this", "finish this", "create my"
+        ),
+        PromptIntent.HELP_ME_LEARN: (
+            "explain", "teach me", "help me understand",
+            "show me how", "walk me through", "quiz me"
+        ),
+        PromptIntent.CLARIFYING: (
+            "what do you mean", "can you clarify", "i don't understand",
+            "could you explain", "what does", "what is the difference"
+        ),
+        PromptIntent.REFLECTION: (
+            "how does this relate", "why is this", "what if",
+            "how would this apply", "connect this to"
+        ),
+    }
+    
+    # (keyword, accumulator, points) for every dimension keyword, so one
+    # loop scores all three dimensions
+    SCORE_TABLE = (
+        tuple((kw, LEARNING, 10) for kw in LEARNING_KEYWORDS) +
+        tuple((kw, LEARNING, -20) for kw in ANTI_LEARNING_KEYWORDS) +
+        tuple((kw, SPECIFICITY, 8) for kw in CONTEXT_WORDS) +
+        tuple((kw, SPECIFICITY, -10) for kw in VAGUE_WORDS) +
+        tuple((kw, ENGAGEMENT, 15) for kw in ENGAGEMENT_KEYWORDS) +
+        tuple((kw, ENGAGEMENT, -10) for kw in PASSIVE_KEYWORDS) +
+        tuple((kw, STEPS, 1) for kw in STEP_INDICATORS)
+    )
+    
     def __init__(self, weights: Optional[ScoreWeights] = None):
         """
         Initialize rubric scorer.
@@ -28,7 +107,37 @@ class RubricScorer(IScoreStrategy):
         Args:
             weights: Optional custom weights for scoring dimensions
         """
-        self.weights = weights or ScoreWeights()
+        self.weights = weights or DEFAULT_WEIGHTS
+        self._cache: Dict[Tuple, PromptScore] = {}
+        self._cache_lock = threading.Lock()
+    
+    @property
+    def weights(self) -> ScoreWeights:
+        """Get the dimension weights."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: ScoreWeights) -> None:
+        """
+        Set the dimension weights.
+        
+        Weights are read when assigned. ScoreWeights is frozen, so the
+        values read here cannot change behind the scorer's back.
+        """
+        self._weights = weights
+        self._weight_values = (
+            weights.learning_orientation, weights.specificity, weights.engagement
+        )
+        # Whole-tenth weights (like the 0.4/0.3/0.3 default) let the total be
+        # computed exactly in integers instead of rounding a float sum
+        tenths = tuple(round(value * 10) for value in self._weight_values)
+        exact = all(isclose(t, value * 10) for t, value in zip(tenths, self._weight_values))
+        self._weight_tenths = tenths if exact else None
+    
+    def cache_clear(self) -> None:
+        """Forget all cached scores."""
+        with self._cache_lock:
+            self._cache.clear()
     
     def calculate_score(
         self, 
@@ -45,111 +154,134 @@ class RubricScorer(IScoreStrategy):
         Returns:
             PromptScore with all dimensions
         """
-        learning = self._score_learning_orientation(prompt)
-        specificity = self._score_specificity(prompt)
-        engagement = self._score_engagement(prompt)
-        intent = self._classify_intent(prompt)
-        
-        total = (
-            learning * self.weights.learning_orientation +
-            specificity * self.weights.specificity +
-            engagement * self.weights.engagement
-        )
-        
-        return PromptScore(
-            total_score=round(total, 1),
-            learning_orientation=round(learning, 1),
-            specificity=round(specificity, 1),
-            engagement=round(engagement, 1),
-            intent=intent
-        )
+        return self.score_view(PromptView.of(prompt), context)
     
-    def _score_learning_orientation(self, prompt: str) -> float:
+    def score_view(
+        self,
+        view: PromptView,
+        context: Optional[str] = None
+    ) -> PromptScore:
         """
-        Score how learning-focused the prompt is.
+        Calculate score using rubric, reusing the view's lowercased prompt.
         
         Args:
-            prompt: The prompt text
+            view: PromptView of the prompt to score
+            context: Optional context (not used in rubric scoring)
             
         Returns:
-            Score from 0-100
+            PromptScore with all dimensions
         """
-        score = 50.0  # Base score
-        prompt_lower = prompt.lower()
-        
-        # Learning keywords (add points)
-        learning_keywords = [
-            "explain", "teach", "help me understand", 
-            "why", "how does", "can you show me",
-            "walk me through", "break down", "clarify",
-            "guide me", "help me learn"
-        ]
-        
-        # Anti-learning keywords (subtract points)
-        anti_keywords = [
-            "write my", "do my", "give me the answer",
-            "solve this for me", "just tell me", "complete this"
-        ]
-        
-        # Check for learning keywords
-        for keyword in learning_keywords:
-            if keyword in prompt_lower:
-                score += 10
+        key = (view.raw, self._weight_values)
+        with self._cache_lock:
+            score = self._cache.get(key)
+        if score is not None:
+            return score
         
-        # Check for anti-learning keywords
-        for keyword in anti_keywords:
-            if keyword in prompt_lower:
-                score -= 20
+        prompt, prompt_lower = view.raw, view.lower
+        learning, specificity, engagement = self._score_dimensions(prompt, prompt_lower)
+        intent = self._classify_intent(prompt, prompt_lower)
         
-        # Bonus for questions (indicates curiosity)
-        if "?" in prompt:
-            score += 5
+        # Dimension scores are whole points, so only the total needs rounding
+        tenths = self._weight_tenths
+        if tenths is not None:
+            total = (learning * tenths[0] + specificity * tenths[1] + engagement * tenths[2]) / 10
+        else:
+            weights = self._weights
+            total = round(
+                learning * weights.learning_orientation +
+                specificity * weights.specificity +
+                engagement * weights.engagement,
+                1
+            )
+        
+        score = PromptScore(
+            total_score=total,
+            learning_orientation=learning,
+            specificity=specificity,
+            engagement=engagement,
+            intent=intent
+        )
         
-        return max(0, min(100, score))
+        with self._cache_lock:
+            self._cache[key] = score
+            # Evict the oldest entries first
+            while len(self._cache) > SCORE_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+        return score
     
-    def _score_specificity(self, prompt: str) -> float:
+    def _score_dimensions(
+        self,
+        prompt: str,
+        prompt_lower: Optional[str] = None
+    ) -> Tuple[float, float, float]:
         """
-        Score how specific and clear the prompt is.
+        Score learning orientation, specificity and engagement together.
         
         Args:
             prompt: The prompt text
+            prompt_lower: prompt.lower(), if the caller already has it
             
         Returns:
-            Score from 0-100
+            (learning_orientation, specificity, engagement), each 0-100
         """
-        score = 50.0
-        prompt_lower = prompt.lower()
+        prompt_lower = prompt_lower or prompt.lower()
+        totals = [50.0, 50.0, 50.0, 0]
+        
+        for keyword, slot, points in self.SCORE_TABLE:
+            if keyword in prompt_lower:
+                totals[slot] += points
+        learning, specificity, engagement, step_count = totals
+        
+        # Bonus for questions (indicates curiosity)
+        question_count = prompt.count("?")
+        if question_count > 0:
+            learning += 5
+            # Questions are often specific
+            specificity += min(10, question_count * 5)
         
         # Length indicates detail (but not too long)
         length = len(prompt)
         if 50 < length < 200:
-            score += 15
+            specificity += 15
         elif 200 <= length < 300:
-            score += 10
+            specificity += 10
         elif length < 20:
-            score -= 15
+            specificity -= 15
         
-        # Questions are often specific
-        question_count = prompt.count("?")
-        if question_count > 0:
-            score += min(10, question_count * 5)
+        # Multiple steps indicate engagement
+        if step_count > 0:
+            engagement += min(15, step_count * 5)
         
-        # Context words indicate specificity
-        context_words = [
-            "because", "specifically", "in the context of",
-            "for example", "such as", "regarding"
-        ]
-        for word in context_words:
-            if word in prompt_lower:
-                score += 8
+        # Clamp to 0-100 inline; cheaper than max(0, min(100, x)) calls
+        return (
+            100 if learning >= 100 else 0 if learning <= 0 else learning,
+            100 if specificity >= 100 else 0 if specificity <= 0 else specificity,
+            100 if engagement >= 100 else 0 if engagement <= 0 else engagement,
+        )
+    
+    def _score_learning_orientation(self, prompt: str) -> float:
+        """
+        Score how learning-focused the prompt is.
         
-        # Vague words reduce specificity
-        vague_words = ["something", "anything", "stuff", "things"]
-        for word in vague_words:
-            if word in prompt_lower:
-                score -= 10
+        Args:
+            prompt: The prompt text
+            
+        Returns:
+            Score from 0-100
+        """
+        return self._score_dimensions(prompt)[0]
+    
+    def _score_specificity(self, prompt: str) -> float:
+        """
+        Score how specific and clear the prompt is.
         
-        return max(0, min(100, score))
+        Args:
+            prompt: The prompt text
+            
+        Returns:
+            Score from 0-100
+        """
+        return self._score_dimensions(prompt)[1]
     
     def _score_engagement(self, prompt: str) -> float:
         """
@@ -161,79 +293,28 @@ class RubricScorer(IScoreStrategy):
         Returns:
             Score from 0-100
         """
-        score = 50.0
-        prompt_lower = prompt.lower()
-        
-        # Interactive keywords
-        engagement_keywords = [
-            "quiz me", "test my understanding", "ask me questions",
-            "practice", "exercise", "check if", "verify",
-            "challenge me", "give me problems", "let me try"
-        ]
-        
-        for keyword in engagement_keywords:
-            if keyword in prompt_lower:
-                score += 15
-        
-        # Passive keywords (reduce engagement)
-        passive_keywords = [
-            "just tell me", "just give me", "simply explain"
-        ]
-        
-        for keyword in passive_keywords:
-            if keyword in prompt_lower:
-                score -= 10
-        
-        # Multiple steps indicate engagement
-        step_indicators = ["then", "after that", "next", "finally"]
-        step_count = sum(1 for word in step_indicators if word in prompt_lower)
-        if step_count > 0:
-            score += min(15, step_count * 5)
-        
-        return max(0, min(100, score))
+        return self._score_dimensions(prompt)[2]
     
-    def _classify_intent(self, prompt: str) -> PromptIntent:
+    def _classify_intent(
+        self,
+        prompt: str,
+        prompt_lower: Optional[str] = None
+    ) -> PromptIntent:
         """
         Classify the prompt's intent.
         
         Args:
             prompt: The prompt text
+            prompt_lower: prompt.lower(), if the caller already has it
             
         Returns:
             PromptIntent enum value
         """
-        prompt_lower = prompt.lower()
-        
-        # Check for "do it for me" intent
-        do_it_patterns = [
-            "write my", "do my", "solve this for me",
-            "complete this", "finish this", "create my"
-        ]
-        if any(pattern in prompt_lower for pattern in do_it_patterns):
-            return PromptIntent.DO_IT_FOR_ME
-        
-        # Check for learning intent
-        learning_patterns = [
-            "explain", "teach me", "help me understand",
-            "show me how", "walk me through", "quiz me"
-        ]
-        if any(pattern in prompt_lower for pattern in learning_patterns):
-            return PromptIntent.HELP_ME_LEARN
-        
-        # Check for clarifying intent
-        clarifying_patterns = [
-            "what do you mean", "can you clarify", "i don't understand",
-            "could you explain", "what does", "what is the difference"
-        ]
-        if any(pattern in prompt_lower for pattern in clarifying_patterns):
-            return PromptIntent.CLARIFYING
+        prompt_lower = prompt_lower or prompt.lower()
         
-        # Check for reflection intent
-        reflection_patterns = [
-            "how does this relate", "why is this", "what if",
-            "how would this apply", "connect this to"
-        ]
-        if any(pattern in prompt_lower for pattern in reflection_patterns):
-            return PromptIntent.REFLECTION
+        for intent, patterns in self.INTENT_PATTERNS.items():
+            for pattern in patterns:
+                if pattern in prompt_lower:
+                    return intent
         
         return PromptIntent.UNKNOWN
@@ -1,8 +1,14 @@
 """Test configuration and fixtures."""
 
+import re
 import pytest
+from functools import lru_cache
 from unittest.mock import Mock
-from src.models import PromptScore, PromptIntent, PromptAnalysis
+from src.models import PromptScore, PromptIntent, PromptAnalysis, Lesson, UserProgress
+from src.services.feedback_generator import FeedbackGenerator
+from src.services.lesson_manager import LessonManager
+from src.services.prompt_analyzer import PromptAnalyzer
+from src.services.score_strategies import RubricScorer
 
 
 @pytest.fixture
@@ -59,3 +65,174 @@ def bad_prompt_analysis(bad_prompt_score):
         ],
         detected_patterns=["do_it_for_me"]
     )
+
+
+@pytest.fixture(scope="session")
+def make_score():
+    """
+    Factory for PromptScore objects from a passing learning-prompt baseline.
+    
+    Call as make_score(total_score=45.0, ...), overriding only the fields
+    the test cares about.
+    """
+    def make(**overrides):
+        fields = dict(
+            total_score=75.0,
+            learning_orientation=80.0,
+            specificity=70.0,
+            engagement=75.0,
+            intent=PromptIntent.HELP_ME_LEARN
+        )
+        fields.update(overrides)
+        return PromptScore(**fields)
+    
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_progress():
+    """
+    Factory for UserProgress objects for a new beginner (user_123).
+    
+    Call as make_progress(total_prompts=10, good_prompts=8, ...), overriding
+    only the fields the test cares about. Each call gets fresh lists.
+    """
+    def make(**overrides):
+        fields = dict(
+            user_id="user_123",
+            current_lesson=1,
+            completed_lessons=[],
+            prompt_history=[],
+            skill_level=1,
+            total_prompts=0,
+            good_prompts=0
+        )
+        fields.update(overrides)
+        return UserProgress(**fields)
+    
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_analysis():
+    """
+    Factory for PromptAnalysis objects, cached on their field values.
+    
+    Call as make_analysis(prompt, (total, learning, specificity, engagement),
+    intent, strengths=(...), ...). Results are shared, so tests must not
+    mutate them.
+    """
+    @lru_cache(maxsize=None)
+    def make(
+        prompt,
+        scores,
+        intent=PromptIntent.HELP_ME_LEARN,
+        strengths=(),
+        improvements=(),
+        examples=(),
+        detected_patterns=()
+    ):
+        total, learning, specificity, engagement = scores
+        return PromptAnalysis(
+            prompt=prompt,
+            score=PromptScore(
+                total_score=total,
+                learning_orientation=learning,
+                specificity=specificity,
+                engagement=engagement,
+                intent=intent
+            ),
+            strengths=list(strengths),
+            improvements=list(improvements),
+            examples=list(examples),
+            detected_patterns=list(detected_patterns)
+        )
+    
+    return make
+
+
+@pytest.fixture(scope="session")
+def feedback_generators():
+    """One FeedbackGenerator per style, for tests that only read feedback."""
+    return {
+        style: FeedbackGenerator(style=style)
+        for style in ("encouraging", "direct", "socratic")
+    }
+
+
+@pytest.fixture(scope="session")
+def encouraging_generator(feedback_generators):
+    """Shared FeedbackGenerator using the default (encouraging) style."""
+    return feedback_generators["encouraging"]
+
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@pytest.fixture(scope="session")
+def assert_any_word():
+    """
+    Assert that text contains at least one of the given words.
+    
+    Lowercases and tokenizes the text once, then intersects with the word
+    set. Words match whole tokens only, so "great" does not match "greater".
+    """
+    def check(text, words):
+        found = set(words) & set(_WORD_RE.findall(text.lower()))
+        assert found, f"none of {sorted(words)} found in {text!r}"
+    
+    return check
+
+
+@pytest.fixture(scope="module")
+def lesson_catalog():
+    """
+    Five lessons l0-l4 with difficulties 1, 2, 3, 1, 2.
+    
+    Built once per module and shared, so tests must not mutate the lessons.
+    """
+    return [
+        Lesson(
+            id=f"l{i}",
+            title=f"Lesson {i}",
+            description="",
+            learning_objectives=[],
+            difficulty=i % 3 + 1,
+            content="",
+            exercises=[]
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def lesson_manager(lesson_catalog):
+    """Fresh LessonManager holding every lesson from lesson_catalog."""
+    manager = LessonManager()
+    for lesson in lesson_catalog:
+        manager.add_lesson(lesson)
+    return manager
+
+
+@pytest.fixture(scope="session")
+def rubric_scorer():
+    """
+    RubricScorer with default weights, shared across the test session.
+    
+    The scorer memoizes scores per prompt, so prompts repeated across test
+    modules are scored once. Tests that change weights or inspect the score
+    cache build their own.
+    """
+    return RubricScorer()
+
+
+@pytest.fixture(scope="session")
+def analyzer(rubric_scorer):
+    """
+    PromptAnalyzer backed by the shared rubric_scorer.
+    
+    The analyzer memoizes analyses per prompt, so a prompt evaluated in
+    several tests is analyzed once per session. Results are shared, so
+    tests must not mutate them.
+    """
+    return PromptAnalyzer(rubric_scorer)
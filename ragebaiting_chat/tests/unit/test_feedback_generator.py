@@ -5,8 +5,9 @@ Following TDD - tests written first to define expected behavior.
 """
 
 import pytest
+from unittest.mock import patch
 from src.services.feedback_generator import FeedbackGenerator
-from src.models import PromptAnalysis, PromptScore, PromptIntent
+from src.models import PromptIntent
 from src.interfaces import IFeedbackProvider
 
 
@@ -14,236 +15,124 @@ class TestFeedbackGenerator:
     """Test FeedbackGenerator implementation."""
     
     @pytest.mark.unit
-    def test_feedback_generator_implements_interface(self):
+    def test_feedback_generator_implements_interface(self, encouraging_generator):
         """Test that FeedbackGenerator implements IFeedbackProvider."""
-        generator = FeedbackGenerator()
-        assert isinstance(generator, IFeedbackProvider)
+        assert isinstance(encouraging_generator, IFeedbackProvider)
     
     @pytest.mark.unit
-    def test_generate_encouraging_feedback(self):
-        """Test generating encouraging feedback style."""
-        generator = FeedbackGenerator(style="encouraging")
-        
-        analysis = PromptAnalysis(
-            prompt="Explain Python decorators",
-            score=PromptScore(
-                total_score=75.0,
-                learning_orientation=80.0,
-                specificity=70.0,
-                engagement=75.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=["Learning-oriented approach"],
-            improvements=["Add interactive elements"],
-            examples=["Try adding: quiz me"],
-            detected_patterns=[]
-        )
-        
-        feedback = generator.generate_feedback(analysis)
-        
-        assert isinstance(feedback, str)
-        assert len(feedback) > 0
+    @pytest.mark.parametrize("style, analysis_fixture, expected_lines", [
         # Encouraging style should be positive
-        assert any(word in feedback.lower() for word in ["great", "good", "excellent", "nice"])
+        ("encouraging", "sample_prompt_analysis", [
+            "👍 Good effort! Your prompt scored 75/100.",
+            "✨ What you did well:",
+            "🎉 Keep up the great work! You're learning effectively!",
+        ]),
+        # Direct style should report the score and list the issues
+        ("direct", "bad_prompt_analysis", [
+            "Prompt Score: 25/100",
+            "Status: NEEDS IMPROVEMENT - This prompt needs refinement.",
+            "Detected Issues:",
+            "1. do_it_for_me",
+            "Required Improvements:",
+        ]),
+        # Socratic style should question the intent and the patterns
+        ("socratic", "bad_prompt_analysis", [
+            "🤔 Consider this: Are you asking the AI to do your work, or to help you learn?",
+            "⚠️  Patterns detected:",
+            "  • do_it_for_me",
+            "What changes could address these patterns?",
+        ]),
+    ])
+    def test_generate_feedback_style(
+        self, style, analysis_fixture, expected_lines, feedback_generators, request
+    ):
+        """Test that each feedback style produces its characteristic lines."""
+        analysis = request.getfixturevalue(analysis_fixture)
+        
+        lines = feedback_generators[style].generate_feedback(analysis).splitlines()
+        
+        for line in expected_lines:
+            assert line in lines
     
     @pytest.mark.unit
-    def test_generate_direct_feedback(self):
-        """Test generating direct feedback style."""
-        generator = FeedbackGenerator(style="direct")
-        
-        analysis = PromptAnalysis(
-            prompt="Do my homework",
-            score=PromptScore(
-                total_score=25.0,
-                learning_orientation=20.0,
-                specificity=30.0,
-                engagement=25.0,
-                intent=PromptIntent.DO_IT_FOR_ME
-            ),
-            strengths=[],
-            improvements=["Rephrase to focus on learning"],
-            examples=["Instead of 'Do my homework', try 'Teach me the concepts'"],
-            detected_patterns=["Do-it-for-me pattern detected"]
-        )
-        
-        feedback = generator.generate_feedback(analysis)
-        
-        assert isinstance(feedback, str)
-        assert len(feedback) > 0
-        # Direct style should be straightforward
-        assert "score" in feedback.lower() or "needs" in feedback.lower()
-    
-    @pytest.mark.unit
-    def test_generate_socratic_feedback(self):
-        """Test generating Socratic feedback style."""
-        generator = FeedbackGenerator(style="socratic")
-        
-        analysis = PromptAnalysis(
-            prompt="Help with coding",
-            score=PromptScore(
-                total_score=45.0,
-                learning_orientation=50.0,
-                specificity=30.0,
-                engagement=55.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=["Learning-oriented"],
-            improvements=["Be more specific"],
-            examples=["What specific coding topic?"],
-            detected_patterns=["Vague language"]
-        )
-        
-        feedback = generator.generate_feedback(analysis)
-        
-        assert isinstance(feedback, str)
-        assert len(feedback) > 0
-        # Socratic style should ask questions
-        assert "?" in feedback
-    
-    @pytest.mark.unit
-    def test_feedback_includes_score(self):
+    def test_feedback_includes_score(self, encouraging_generator, make_analysis):
         """Test that feedback includes the score."""
-        generator = FeedbackGenerator()
-        
-        analysis = PromptAnalysis(
-            prompt="Test prompt",
-            score=PromptScore(
-                total_score=65.0,
-                learning_orientation=70.0,
-                specificity=60.0,
-                engagement=65.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=["Good attempt"],
-            improvements=[],
-            examples=[],
-            detected_patterns=[]
+        analysis = make_analysis(
+            "Test prompt", (65.0, 70.0, 60.0, 65.0),
+            strengths=("Good attempt",)
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
         
         # Should mention the score
         assert "65" in feedback or "score" in feedback.lower()
     
     @pytest.mark.unit
-    def test_feedback_includes_strengths(self):
+    def test_feedback_includes_strengths(self, encouraging_generator, make_analysis):
         """Test that feedback includes identified strengths."""
-        generator = FeedbackGenerator()
-        
-        analysis = PromptAnalysis(
-            prompt="Explain recursion with examples, then quiz me",
-            score=PromptScore(
-                total_score=85.0,
-                learning_orientation=90.0,
-                specificity=80.0,
-                engagement=85.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=["Learning-oriented approach", "Interactive learning requested"],
-            improvements=[],
-            examples=[],
-            detected_patterns=[]
+        analysis = make_analysis(
+            "Explain recursion with examples, then quiz me", (85.0, 90.0, 80.0, 85.0),
+            strengths=("Learning-oriented approach", "Interactive learning requested")
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
+        feedback_lower = feedback.lower()
         
         # Should mention strengths
-        assert "learning-oriented" in feedback.lower() or "interactive" in feedback.lower()
+        assert "learning-oriented" in feedback_lower or "interactive" in feedback_lower
     
     @pytest.mark.unit
-    def test_feedback_includes_improvements(self):
+    def test_feedback_includes_improvements(self, encouraging_generator, make_analysis):
         """Test that feedback includes improvement suggestions."""
-        generator = FeedbackGenerator()
-        
-        analysis = PromptAnalysis(
-            prompt="Help",
-            score=PromptScore(
-                total_score=30.0,
-                learning_orientation=40.0,
-                specificity=20.0,
-                engagement=30.0,
-                intent=PromptIntent.UNKNOWN
-            ),
-            strengths=[],
-            improvements=["Add more specific details", "Expand your prompt"],
-            examples=["Instead of 'Help', try 'Explain X'"],
-            detected_patterns=["Very short prompt"]
+        analysis = make_analysis(
+            "Help", (30.0, 40.0, 20.0, 30.0), PromptIntent.UNKNOWN,
+            improvements=("Add more specific details", "Expand your prompt"),
+            examples=("Instead of 'Help', try 'Explain X'",),
+            detected_patterns=("Very short prompt",)
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
+        feedback_lower = feedback.lower()
         
         # Should mention improvements
-        assert "specific" in feedback.lower() or "improve" in feedback.lower()
+        assert "specific" in feedback_lower or "improve" in feedback_lower
     
     @pytest.mark.unit
-    def test_feedback_includes_anti_patterns(self):
+    def test_feedback_includes_anti_patterns(self, encouraging_generator, make_analysis):
         """Test that feedback mentions detected anti-patterns."""
-        generator = FeedbackGenerator()
-        
-        analysis = PromptAnalysis(
-            prompt="Write my essay",
-            score=PromptScore(
-                total_score=20.0,
-                learning_orientation=10.0,
-                specificity=30.0,
-                engagement=20.0,
-                intent=PromptIntent.DO_IT_FOR_ME
-            ),
-            strengths=[],
-            improvements=["Shift from 'do it for me' to 'teach me how'"],
-            examples=["Instead of 'Write my essay', try 'Help me structure my thoughts'"],
-            detected_patterns=["Do-it-for-me pattern detected"]
+        analysis = make_analysis(
+            "Write my essay", (20.0, 10.0, 30.0, 20.0), PromptIntent.DO_IT_FOR_ME,
+            improvements=("Shift from 'do it for me' to 'teach me how'",),
+            examples=("Instead of 'Write my essay', try 'Help me structure my thoughts'",),
+            detected_patterns=("Do-it-for-me pattern detected",)
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
+        feedback_lower = feedback.lower()
         
         # Should mention the anti-pattern
-        assert "do-it-for-me" in feedback.lower() or "pattern" in feedback.lower()
+        assert "do-it-for-me" in feedback_lower or "pattern" in feedback_lower
     
     @pytest.mark.unit
-    def test_feedback_includes_examples(self):
+    def test_feedback_includes_examples(self, encouraging_generator, make_analysis):
         """Test that feedback includes example prompts."""
-        generator = FeedbackGenerator()
-        
-        analysis = PromptAnalysis(
-            prompt="Vague request",
-            score=PromptScore(
-                total_score=35.0,
-                learning_orientation=40.0,
-                specificity=25.0,
-                engagement=40.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=[],
-            improvements=["Be more specific"],
-            examples=["Instead of 'Vague request', try 'Explain X with examples'"],
-            detected_patterns=[]
+        analysis = make_analysis(
+            "Vague request", (35.0, 40.0, 25.0, 40.0),
+            improvements=("Be more specific",),
+            examples=("Instead of 'Vague request', try 'Explain X with examples'",)
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
+        feedback_lower = feedback.lower()
         
         # Should include examples
-        assert "instead" in feedback.lower() or "try" in feedback.lower() or "example" in feedback.lower()
+        assert "instead" in feedback_lower or "try" in feedback_lower or "example" in feedback_lower
     
     @pytest.mark.unit
-    def test_change_feedback_style(self):
+    def test_change_feedback_style(self, make_analysis):
         """Test changing feedback style after initialization."""
         generator = FeedbackGenerator(style="encouraging")
-        
-        analysis = PromptAnalysis(
-            prompt="Test",
-            score=PromptScore(
-                total_score=50.0,
-                learning_orientation=50.0,
-                specificity=50.0,
-                engagement=50.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=[],
-            improvements=[],
-            examples=[],
-            detected_patterns=[]
-        )
+        analysis = make_analysis("Test", (50.0, 50.0, 50.0, 50.0))
         
         encouraging_feedback = generator.generate_feedback(analysis)
         
@@ -263,26 +152,60 @@ class TestFeedbackGenerator:
         assert generator.style in ["encouraging", "direct", "socratic"]
     
     @pytest.mark.unit
-    def test_high_score_feedback_is_positive(self):
-        """Test that high-scoring prompts get positive feedback."""
-        generator = FeedbackGenerator()
+    def test_repeated_analysis_reuses_feedback(self, make_analysis):
+        """Test that identical analyses are formatted once per style."""
+        analysis = make_analysis("Test", (50.0, 50.0, 50.0, 50.0), strengths=("Clear goal",))
+        formatter = FeedbackGenerator._generate_direct_feedback
+        
+        # Patched on the class before construction, so the generator binds the spy
+        with patch.object(
+            FeedbackGenerator, "_generate_direct_feedback", autospec=True, side_effect=formatter
+        ) as spy:
+            generator = FeedbackGenerator(style="direct")
+            first = generator.generate_feedback(analysis)
+            second = generator.generate_feedback(analysis)
+        
+        assert first == second
+        assert spy.call_count == 1
+        
+        # A different style is cached separately
+        generator.style = "socratic"
+        assert generator.generate_feedback(analysis) != first
+    
+    @pytest.mark.unit
+    def test_style_argument_overrides_shared_style(self, make_analysis):
+        """Test that a per-call style is used and cached without changing .style."""
+        generator = FeedbackGenerator(style="encouraging")
+        analysis = make_analysis("Test", (50.0, 50.0, 50.0, 50.0))
         
-        analysis = PromptAnalysis(
-            prompt="Excellent prompt",
-            score=PromptScore(
-                total_score=95.0,
-                learning_orientation=95.0,
-                specificity=95.0,
-                engagement=95.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            ),
-            strengths=["Learning-oriented", "Specific", "Interactive"],
-            improvements=[],
-            examples=[],
-            detected_patterns=[]
+        direct = generator.generate_feedback(analysis, style="direct")
+        socratic = generator.generate_feedback(analysis, style="socratic")
+        
+        assert generator.style == "encouraging"
+        assert direct == FeedbackGenerator(style="direct").generate_feedback(analysis)
+        assert socratic == FeedbackGenerator(style="socratic").generate_feedback(analysis)
+        assert generator.generate_feedback(analysis) not in (direct, socratic)
+    
+    @pytest.mark.unit
+    def test_invalid_style_change_defaults_to_encouraging(self):
+        """Test that setting an invalid style later also falls back."""
+        generator = FeedbackGenerator(style="socratic")
+        
+        generator.style = "invalid_style"
+        
+        assert generator.style == "encouraging"
+    
+    @pytest.mark.unit
+    def test_high_score_feedback_is_positive(
+        self, encouraging_generator, make_analysis, assert_any_word
+    ):
+        """Test that high-scoring prompts get positive feedback."""
+        analysis = make_analysis(
+            "Excellent prompt", (95.0, 95.0, 95.0, 95.0),
+            strengths=("Learning-oriented", "Specific", "Interactive")
         )
         
-        feedback = generator.generate_feedback(analysis)
+        feedback = encouraging_generator.generate_feedback(analysis)
         
         # High scores should get positive feedback
-        assert any(word in feedback.lower() for word in ["excellent", "great", "outstanding", "strong"])
+        assert_any_word(feedback, ["excellent", "great", "outstanding", "strong"])
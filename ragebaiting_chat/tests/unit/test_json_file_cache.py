@@ -0,0 +1,66 @@
+"""
+Unit tests for JsonFileCache.
+
+Verifies entries persist to disk, respect max_entries, and survive bad files.
+"""
+
+import pytest
+from src.infrastructure.json_file_cache import JsonFileCache
+
+
+class TestJsonFileCache:
+    """Test JsonFileCache implementation."""
+    
+    @pytest.mark.unit
+    def test_set_and_get_entry(self, tmp_path):
+        """Test storing and reading back an entry."""
+        cache = JsonFileCache(str(tmp_path / "cache.json"))
+        
+        cache["key"] = {"answer": "value"}
+        
+        assert cache["key"] == {"answer": "value"}
+        assert "key" in cache
+        assert len(cache) == 1
+    
+    @pytest.mark.unit
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a new cache on the same file sees earlier entries."""
+        path = str(tmp_path / "nested" / "cache.json")
+        JsonFileCache(path)["key"] = "value"
+        
+        reloaded = JsonFileCache(path)
+        
+        assert reloaded["key"] == "value"
+    
+    @pytest.mark.unit
+    def test_max_entries_evicts_oldest(self, tmp_path):
+        """Test that the oldest entry is evicted once the limit is reached."""
+        cache = JsonFileCache(str(tmp_path / "cache.json"), max_entries=2)
+        
+        cache["first"] = 1
+        cache["second"] = 2
+        cache["first"] = 1  # Rewriting makes it the newest entry
+        cache["third"] = 3
+        
+        assert list(cache) == ["first", "third"]
+    
+    @pytest.mark.unit
+    def test_delete_entry(self, tmp_path):
+        """Test deleting an entry removes it from disk too."""
+        path = str(tmp_path / "cache.json")
+        cache = JsonFileCache(path)
+        cache["key"] = "value"
+        
+        del cache["key"]
+        
+        assert "key" not in JsonFileCache(path)
+    
+    @pytest.mark.unit
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """Test that an unreadable cache file is treated as empty."""
+        path = tmp_path / "cache.json"
+        path.write_text("not json")
+        
+        cache = JsonFileCache(str(path))
+        
+        assert len(cache) == 0
@@ -52,38 +52,16 @@ class TestLessonManager:
         assert result is None
     
     @pytest.mark.unit
-    def test_get_lessons_by_level(self):
+    def test_get_lessons_by_level(self, lesson_manager):
         """Test filtering lessons by difficulty level."""
-        manager = LessonManager()
-        
-        # Add lessons with different difficulties
-        lesson1 = Lesson(id="l1", title="Easy", description="Easy lesson", learning_objectives=[], difficulty=1, content="Content", exercises=[])
-        lesson2 = Lesson(id="l2", title="Medium", description="Medium lesson", learning_objectives=[], difficulty=2, content="Content", exercises=[])
-        lesson3 = Lesson(id="l3", title="Hard", description="Hard lesson", learning_objectives=[], difficulty=3, content="Content", exercises=[])
-        lesson4 = Lesson(id="l4", title="Easy 2", description="Another easy", learning_objectives=[], difficulty=1, content="Content", exercises=[])
-        
-        manager.add_lesson(lesson1)
-        manager.add_lesson(lesson2)
-        manager.add_lesson(lesson3)
-        manager.add_lesson(lesson4)
-        
-        easy_lessons = manager.get_lessons_by_level(1)
+        easy_lessons = lesson_manager.get_lessons_by_level(1)
         
         assert len(easy_lessons) == 2
         assert all(lesson.difficulty == 1 for lesson in easy_lessons)
     
     @pytest.mark.unit
-    def test_get_next_lesson_beginner(self):
+    def test_get_next_lesson_beginner(self, lesson_manager):
         """Test getting next lesson for beginner (skill_level=1)."""
-        manager = LessonManager()
-        
-        # Add lessons
-        lesson1 = Lesson(id="l1", title="Beginner", description="Start here", learning_objectives=[], difficulty=1, content="Content", exercises=[])
-        lesson2 = Lesson(id="l2", title="Advanced", description="Later", learning_objectives=[], difficulty=3, content="Content", exercises=[])
-        
-        manager.add_lesson(lesson1)
-        manager.add_lesson(lesson2)
-        
         progress = UserProgress(
             user_id="user1",
             current_lesson=0,
@@ -94,104 +72,71 @@ class TestLessonManager:
             good_prompts=0
         )
         
-        next_lesson = manager.get_next_lesson(progress)
+        next_lesson = lesson_manager.get_next_lesson(progress)
         
         assert next_lesson is not None
         assert next_lesson.difficulty == 1
     
     @pytest.mark.unit
-    def test_get_next_lesson_intermediate(self):
+    def test_get_next_lesson_intermediate(self, lesson_manager):
         """Test getting next lesson for intermediate learner (skill_level=2)."""
-        manager = LessonManager()
-        
-        # Add lessons
-        lesson1 = Lesson(id="l1", title="Beginner", description="Start", learning_objectives=[], difficulty=1, content="Content", exercises=[])
-        lesson2 = Lesson(id="l2", title="Intermediate", description="Next", learning_objectives=[], difficulty=2, content="Content", exercises=[])
-        lesson3 = Lesson(id="l3", title="Advanced", description="Later", learning_objectives=[], difficulty=3, content="Content", exercises=[])
-        
-        manager.add_lesson(lesson1)
-        manager.add_lesson(lesson2)
-        manager.add_lesson(lesson3)
-        
         progress = UserProgress(
             user_id="user1",
             current_lesson=1,
-            completed_lessons=["l1"],
+            completed_lessons=["l0"],
             prompt_history=[],
             skill_level=2,
             total_prompts=10,
             good_prompts=8
         )
         
-        next_lesson = manager.get_next_lesson(progress)
+        next_lesson = lesson_manager.get_next_lesson(progress)
         
         assert next_lesson is not None
         assert next_lesson.difficulty == 2
     
     @pytest.mark.unit
-    def test_get_next_lesson_skips_completed(self):
+    def test_get_next_lesson_skips_completed(self, lesson_manager):
         """Test that next lesson skips already completed lessons."""
-        manager = LessonManager()
-        
-        lesson1 = Lesson(id="l1", title="First", description="", learning_objectives=[], difficulty=1, content="", exercises=[])
-        lesson2 = Lesson(id="l2", title="Second", description="", learning_objectives=[], difficulty=1, content="", exercises=[])
-        
-        manager.add_lesson(lesson1)
-        manager.add_lesson(lesson2)
-        
         progress = UserProgress(
             user_id="user1",
             current_lesson=1,
-            completed_lessons=["l1"],
+            completed_lessons=["l0"],
             prompt_history=[],
             skill_level=1,
             total_prompts=5,
             good_prompts=4
         )
         
-        next_lesson = manager.get_next_lesson(progress)
+        next_lesson = lesson_manager.get_next_lesson(progress)
         
         assert next_lesson is not None
-        assert next_lesson.id == "l2"
+        assert next_lesson.id == "l3"
     
     @pytest.mark.unit
-    def test_get_next_lesson_all_completed_returns_none(self):
+    def test_get_next_lesson_all_completed_returns_none(self, lesson_manager, lesson_catalog):
         """Test that next lesson returns None when all are completed."""
-        manager = LessonManager()
-        
-        lesson1 = Lesson(id="l1", title="Only", description="", learning_objectives=[], difficulty=1, content="", exercises=[])
-        manager.add_lesson(lesson1)
-        
         progress = UserProgress(
             user_id="user1",
-            current_lesson=1,
-            completed_lessons=["l1"],
+            current_lesson=len(lesson_catalog),
+            completed_lessons=[lesson.id for lesson in lesson_catalog],
             prompt_history=[],
             skill_level=1,
             total_prompts=5,
             good_prompts=5
         )
         
-        next_lesson = manager.get_next_lesson(progress)
+        next_lesson = lesson_manager.get_next_lesson(progress)
         
         assert next_lesson is None
     
     @pytest.mark.unit
-    def test_add_multiple_lessons(self):
+    def test_add_multiple_lessons(self, lesson_manager, lesson_catalog):
         """Test adding multiple lessons."""
-        manager = LessonManager()
-        
-        lessons = [
-            Lesson(id=f"l{i}", title=f"Lesson {i}", description="", learning_objectives=[], difficulty=i % 3 + 1, content="", exercises=[])
-            for i in range(5)
-        ]
-        
-        for lesson in lessons:
-            manager.add_lesson(lesson)
-        
-        all_beginner = manager.get_lessons_by_level(1)
+        all_beginner = lesson_manager.get_lessons_by_level(1)
         
         assert len(all_beginner) > 0
+        assert all(lesson_manager.get_lesson(lesson.id) is lesson for lesson in lesson_catalog)
     
     @pytest.mark.unit
     def test_lesson_with_exercises(self):
@@ -260,23 +205,41 @@ class TestLessonManager:
         assert retrieved.difficulty == 2
     
     @pytest.mark.unit
-    def test_get_all_lessons(self):
+    def test_get_all_lessons(self, lesson_manager, lesson_catalog):
         """Test getting all lessons."""
+        all_lessons = lesson_manager.get_all_lessons()
+        
+        assert len(all_lessons) == len(lesson_catalog)
+    
+    @pytest.mark.unit
+    def test_get_all_lessons_sorted_by_difficulty(self):
+        """Test that sorted lessons are ordered easiest first."""
         manager = LessonManager()
         
-        # Add lessons
-        for i in range(3):
-            lesson = Lesson(
-                id=f"l{i}",
-                title=f"Lesson {i}",
-                description="",
-                learning_objectives=[],
-                difficulty=1,
-                content="",
-                exercises=[]
-            )
-            manager.add_lesson(lesson)
+        for lesson_id, difficulty in [("l1", 3), ("l2", 1), ("l3", 2)]:
+            manager.add_lesson(Lesson(id=lesson_id, title=lesson_id, description="", learning_objectives=[], difficulty=difficulty, content="", exercises=[]))
         
-        all_lessons = manager.get_all_lessons()
+        sorted_lessons = manager.get_all_lessons_sorted()
+        
+        assert [lesson.id for lesson in sorted_lessons] == ["l2", "l3", "l1"]
+    
+    @pytest.mark.unit
+    def test_sorted_lessons_cached_until_lesson_added(self):
+        """Test that the sorted catalog is reused and refreshed on add_lesson."""
+        manager = LessonManager()
+        manager.add_lesson(Lesson(id="l1", title="Hard", description="", learning_objectives=[], difficulty=3, content="", exercises=[]))
+        
+        first = manager.get_all_lessons_sorted()
+        assert manager.get_all_lessons_sorted() is first
+        
+        manager.add_lesson(Lesson(id="l2", title="Easy", description="", learning_objectives=[], difficulty=1, content="", exercises=[]))
+        
+        assert [lesson.id for lesson in manager.get_all_lessons_sorted()] == ["l2", "l1"]
+    
+    @pytest.mark.unit
+    def test_update_moves_lesson_between_levels(self, lesson_manager):
+        """Test that changing a lesson's difficulty moves it to the new level."""
+        lesson_manager.add_lesson(Lesson(id="l0", title="Now medium", description="", learning_objectives=[], difficulty=2, content="", exercises=[]))
         
-        assert len(all_lessons) == 3
+        assert [lesson.id for lesson in lesson_manager.get_lessons_by_level(1)] == ["l3"]
+        assert [lesson.id for lesson in lesson_manager.get_lessons_by_level(2)] == ["l0", "l1", "l4"]
@@ -5,6 +5,7 @@ Following TDD methodology - these tests drive the implementation.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from src.models import (
     PromptIntent,
@@ -15,6 +16,8 @@ from src.models import (
     UserProgress,
     CoachConfig,
     ScoreWeights,
+    DEFAULT_WEIGHTS,
+    PROMPT_HISTORY_LIMIT,
 )
 
 
@@ -39,21 +42,15 @@ class TestPromptScore:
         assert score.intent == PromptIntent.HELP_ME_LEARN
     
     @pytest.mark.unit
-    def test_is_passing_property_true(self):
+    def test_is_passing_property_true(self, make_score):
         """Test is_passing returns True for score >= 60."""
-        score = PromptScore(
-            total_score=75.0,
-            learning_orientation=80.0,
-            specificity=70.0,
-            engagement=75.0,
-            intent=PromptIntent.HELP_ME_LEARN
-        )
+        score = make_score()
         assert score.is_passing is True
     
     @pytest.mark.unit
-    def test_is_passing_property_false(self):
+    def test_is_passing_property_false(self, make_score):
         """Test is_passing returns False for score < 60."""
-        score = PromptScore(
+        score = make_score(
             total_score=45.0,
             learning_orientation=50.0,
             specificity=40.0,
@@ -63,9 +60,9 @@ class TestPromptScore:
         assert score.is_passing is False
     
     @pytest.mark.unit
-    def test_is_passing_boundary(self):
+    def test_is_passing_boundary(self, make_score):
         """Test is_passing at boundary (60.0)."""
-        score = PromptScore(
+        score = make_score(
             total_score=60.0,
             learning_orientation=60.0,
             specificity=60.0,
@@ -75,43 +72,25 @@ class TestPromptScore:
         assert score.is_passing is True
     
     @pytest.mark.unit
-    def test_invalid_score_raises_error(self):
-        """Test that invalid scores raise ValueError."""
-        with pytest.raises(ValueError, match="total_score must be between 0 and 100"):
-            PromptScore(
-                total_score=150.0,  # Invalid
-                learning_orientation=80.0,
-                specificity=70.0,
-                engagement=75.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            )
-    
-    @pytest.mark.unit
-    def test_negative_score_raises_error(self):
-        """Test that negative scores raise ValueError."""
-        with pytest.raises(ValueError, match="learning_orientation must be between 0 and 100"):
-            PromptScore(
-                total_score=75.0,
-                learning_orientation=-10.0,  # Invalid
-                specificity=70.0,
-                engagement=75.0,
-                intent=PromptIntent.HELP_ME_LEARN
-            )
+    @pytest.mark.parametrize("field, value", [
+        ("total_score", 150.0),
+        ("learning_orientation", -10.0),
+        ("specificity", 100.5),
+        ("engagement", -0.1),
+    ])
+    def test_out_of_range_score_raises_error(self, make_score, field, value):
+        """Test that scores outside 0-100 raise ValueError naming the field."""
+        with pytest.raises(ValueError, match=f"{field} must be between 0 and 100"):
+            make_score(**{field: value})
 
 
 class TestPromptAnalysis:
     """Test PromptAnalysis model."""
     
     @pytest.mark.unit
-    def test_prompt_analysis_creation(self):
+    def test_prompt_analysis_creation(self, make_score):
         """Test creating a PromptAnalysis."""
-        score = PromptScore(
-            total_score=75.0,
-            learning_orientation=80.0,
-            specificity=70.0,
-            engagement=75.0,
-            intent=PromptIntent.HELP_ME_LEARN
-        )
+        score = make_score()
         
         analysis = PromptAnalysis(
             prompt="Explain Python and quiz me",
@@ -127,6 +106,24 @@ class TestPromptAnalysis:
         assert len(analysis.strengths) == 2
         assert len(analysis.improvements) == 1
         assert len(analysis.detected_patterns) == 0
+    
+    @pytest.mark.unit
+    def test_prompt_analysis_uses_slots(self, sample_prompt_analysis):
+        """Test that analyses carry no per-instance __dict__."""
+        assert not hasattr(sample_prompt_analysis, "__dict__")
+        assert not hasattr(sample_prompt_analysis.score, "__dict__")
+        
+        # Frozen slotted classes raise TypeError here on Python 3.11
+        with pytest.raises((AttributeError, TypeError)):
+            sample_prompt_analysis.unexpected = True
+    
+    @pytest.mark.unit
+    def test_prompt_analysis_is_frozen(self, sample_prompt_analysis):
+        """Test that shared (cached) analyses and scores cannot be edited."""
+        with pytest.raises(FrozenInstanceError):
+            sample_prompt_analysis.strengths = []
+        with pytest.raises(FrozenInstanceError):
+            sample_prompt_analysis.score.total_score = 0.0
 
 
 class TestLesson:
@@ -176,7 +173,8 @@ class TestLesson:
         assert lesson.exercises[0].id == "ex_01"
     
     @pytest.mark.unit
-    def test_invalid_difficulty_raises_error(self):
+    @pytest.mark.parametrize("difficulty", [0, 6])
+    def test_invalid_difficulty_raises_error(self, difficulty):
         """Test that invalid difficulty raises ValueError."""
         with pytest.raises(ValueError, match="Difficulty must be between 1 and 5"):
             Lesson(
@@ -184,7 +182,7 @@ class TestLesson:
                 title="Title",
                 description="Description",
                 learning_objectives=["Objective"],
-                difficulty=6,  # Invalid
+                difficulty=difficulty,
                 content="Content"
             )
 
@@ -213,48 +211,63 @@ class TestUserProgress:
         assert progress.good_prompts == 8
     
     @pytest.mark.unit
-    def test_success_rate_calculation(self):
+    def test_success_rate_calculation(self, make_progress):
         """Test success rate property."""
-        progress = UserProgress(
-            user_id="user_123",
-            current_lesson=1,
-            completed_lessons=[],
-            prompt_history=[],
-            skill_level=1,
-            total_prompts=10,
-            good_prompts=8
-        )
+        progress = make_progress(total_prompts=10, good_prompts=8)
         
         assert progress.success_rate == 80.0
     
     @pytest.mark.unit
-    def test_success_rate_zero_prompts(self):
+    def test_success_rate_zero_prompts(self, make_progress):
         """Test success rate with zero prompts."""
-        progress = UserProgress(
-            user_id="user_123",
-            current_lesson=1,
-            completed_lessons=[],
-            prompt_history=[],
-            skill_level=1,
-            total_prompts=0,
-            good_prompts=0
-        )
+        progress = make_progress()
         
         assert progress.success_rate == 0.0
     
     @pytest.mark.unit
-    def test_invalid_skill_level_raises_error(self):
+    def test_record_prompt_updates_counters(self, make_progress, sample_prompt_analysis):
+        """Test that recording a prompt updates counts, rate and history."""
+        progress = make_progress(total_prompts=1)
+        
+        progress.record_prompt(sample_prompt_analysis)
+        
+        assert progress.total_prompts == 2
+        assert progress.good_prompts == int(sample_prompt_analysis.score.is_passing)
+        assert progress.success_rate == progress.good_prompts / 2 * 100
+        assert progress.prompt_history[-1] is sample_prompt_analysis
+    
+    @pytest.mark.unit
+    def test_replace_history_updates_counters(self, make_progress, make_analysis):
+        """Test that re-scored history updates good prompts and success rate."""
+        passing = make_analysis("Explain X", (75.0, 80.0, 70.0, 75.0))
+        failing = make_analysis("Explain X", (40.0, 40.0, 40.0, 40.0))
+        # One older passing prompt has already left the history
+        progress = make_progress(total_prompts=3, good_prompts=3)
+        progress.prompt_history.extend([passing, passing])
+        
+        progress.replace_history([failing, passing])
+        
+        assert list(progress.prompt_history) == [failing, passing]
+        assert progress.total_prompts == 3
+        assert progress.good_prompts == 2
+        assert progress.success_rate == pytest.approx(200 / 3)
+    
+    @pytest.mark.unit
+    def test_prompt_history_is_bounded(self, make_progress, sample_prompt_analysis):
+        """Test that prompt history keeps only the most recent analyses."""
+        progress = make_progress()
+        
+        for _ in range(PROMPT_HISTORY_LIMIT + 5):
+            progress.prompt_history.append(sample_prompt_analysis)
+        
+        assert len(progress.prompt_history) == PROMPT_HISTORY_LIMIT
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("skill_level", [0, 6])
+    def test_invalid_skill_level_raises_error(self, make_progress, skill_level):
         """Test that invalid skill level raises ValueError."""
         with pytest.raises(ValueError, match="Skill level must be between 1 and 5"):
-            UserProgress(
-                user_id="user_123",
-                current_lesson=1,
-                completed_lessons=[],
-                prompt_history=[],
-                skill_level=0,  # Invalid
-                total_prompts=0,
-                good_prompts=0
-            )
+            make_progress(skill_level=skill_level)
 
 
 class TestCoachConfig:
@@ -288,19 +301,14 @@ class TestCoachConfig:
         assert config.save_history is False
     
     @pytest.mark.unit
-    def test_empty_api_key_raises_error(self):
-        """Test that empty API key raises ValueError."""
-        with pytest.raises(ValueError, match="API key cannot be empty"):
-            CoachConfig(api_key="")
-    
-    @pytest.mark.unit
-    def test_invalid_feedback_style_raises_error(self):
-        """Test that invalid feedback style raises ValueError."""
-        with pytest.raises(ValueError, match="feedback_style must be one of"):
-            CoachConfig(
-                api_key="sk-test-key",
-                feedback_style="invalid"
-            )
+    @pytest.mark.parametrize("kwargs, message", [
+        (dict(api_key=""), "API key cannot be empty"),
+        (dict(api_key="sk-test-key", feedback_style="invalid"), "feedback_style must be one of"),
+    ])
+    def test_invalid_config_raises_error(self, kwargs, message):
+        """Test that an empty API key or unknown feedback style raises ValueError."""
+        with pytest.raises(ValueError, match=message):
+            CoachConfig(**kwargs)
 
 
 class TestScoreWeights:
@@ -329,14 +337,38 @@ class TestScoreWeights:
         assert weights.engagement == 0.2
     
     @pytest.mark.unit
-    def test_invalid_weights_sum_raises_error(self):
+    def test_shared_default_weights(self):
+        """Test the shared default instance matches a fresh one."""
+        assert DEFAULT_WEIGHTS == ScoreWeights()
+    
+    @pytest.mark.unit
+    def test_score_weights_are_frozen(self):
+        """Test that the shared default weights cannot be mutated in place."""
+        with pytest.raises(FrozenInstanceError):
+            DEFAULT_WEIGHTS.learning_orientation = 0.9
+        
+        assert DEFAULT_WEIGHTS.learning_orientation == 0.4
+    
+    @pytest.mark.unit
+    def test_weights_within_tolerance_are_accepted(self):
+        """Test that sums within 0.01 of 1.0 are accepted."""
+        weights = ScoreWeights(
+            learning_orientation=0.333,
+            specificity=0.333,
+            engagement=0.333
+        )
+        
+        assert weights.engagement == 0.333
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("weights", [
+        (0.5, 0.5, 0.5),  # Sum = 1.5
+        (0.1, 0.1, 0.1),  # Sum = 0.3
+    ])
+    def test_invalid_weights_sum_raises_error(self, weights):
         """Test that weights not summing to 1.0 raise ValueError."""
         with pytest.raises(ValueError, match="Weights must sum to 1.0"):
-            ScoreWeights(
-                learning_orientation=0.5,
-                specificity=0.5,
-                engagement=0.5  # Sum = 1.5, invalid
-            )
+            ScoreWeights(*weights)
 
 
 class TestPromptIntent:
@@ -0,0 +1,93 @@
+"""
+Unit tests for OpenAIClient.
+
+The OpenAI SDK client is replaced with a Mock, so no network calls are made.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from src.infrastructure.openai_client import (
+    OpenAIClient,
+    HTTP_TIMEOUT,
+    INTENT_SYSTEM_PROMPT,
+)
+from src.models import PromptIntent
+
+
+def completion(content):
+    """Build a fake non-streaming chat completion response."""
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
+@pytest.fixture
+def client():
+    """OpenAIClient whose SDK client is a Mock."""
+    client = OpenAIClient(api_key="sk-test-key")
+    client.client = Mock()
+    return client
+
+
+class TestOpenAIClient:
+    """Test OpenAIClient implementation."""
+    
+    @pytest.mark.unit
+    def test_analyze_prompt_intent_maps_response(self, client):
+        """Test that the model's category name maps to a PromptIntent."""
+        client.client.chat.completions.create.return_value = completion(" Help_Me_Learn\n")
+        
+        assert client.analyze_prompt_intent("Explain recursion") == PromptIntent.HELP_ME_LEARN
+    
+    @pytest.mark.unit
+    def test_intent_uses_classifier_model_and_short_reply(self):
+        """Test that classification uses the cheap model, not the chat model."""
+        client = OpenAIClient(api_key="sk-test-key", model="gpt-4o")
+        client.client = Mock()
+        create = client.client.chat.completions.create
+        create.return_value = completion("clarifying")
+        
+        assert client.analyze_prompt_intent("What do you mean?") == PromptIntent.CLARIFYING
+        
+        options = create.call_args.kwargs
+        assert options["model"] == "gpt-4o-mini"
+        assert options["max_tokens"] == 8
+        assert options["temperature"] == 0.0
+        assert options["messages"][0] == {"role": "system", "content": INTENT_SYSTEM_PROMPT}
+    
+    @pytest.mark.unit
+    def test_repeated_prompt_intent_is_cached(self, client):
+        """Test that a repeated prompt is classified with one API call."""
+        create = client.client.chat.completions.create
+        create.return_value = completion("do_it_for_me")
+        
+        first = client.analyze_prompt_intent("Write my essay")
+        second = client.analyze_prompt_intent("Write my essay")
+        
+        assert first == second == PromptIntent.DO_IT_FOR_ME
+        assert create.call_count == 1
+        
+        # A different classifier model classifies the prompt again
+        client.classifier_model = "gpt-3.5-turbo"
+        client.analyze_prompt_intent("Write my essay")
+        
+        assert create.call_count == 2
+    
+    @pytest.mark.unit
+    def test_failed_intent_call_is_not_cached(self, client):
+        """Test that API errors fall back to UNKNOWN without being cached."""
+        create = client.client.chat.completions.create
+        create.side_effect = [Exception("timeout"), completion("reflection")]
+        
+        assert client.analyze_prompt_intent("Why?") == PromptIntent.UNKNOWN
+        assert client.analyze_prompt_intent("Why?") == PromptIntent.REFLECTION
+    
+    @pytest.mark.unit
+    def test_each_client_gets_its_own_http_client(self):
+        """Test that SDK clients get separate HTTP clients with the short timeout."""
+        with patch("src.infrastructure.openai_client.OpenAI") as sdk:
+            OpenAIClient(api_key="sk-test-key")
+            OpenAIClient(api_key="sk-other-key")
+        
+        first, second = (call.kwargs["http_client"] for call in sdk.call_args_list)
+        
+        assert first is not second
+        assert first.timeout == HTTP_TIMEOUT
@@ -9,10 +9,28 @@ Verifies:
 - DemonstrationResult contains all required fields
 """
 
+import threading
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.services import PromptDemonstrator
 from src.models import DemonstrationResult
+from src.interfaces import IAIClient
+
+
+def respond_by_system_prompt(bad: str, good: str):
+    """Mock chat side effect keyed on the system prompt (calls run concurrently)."""
+    def chat(messages, **kwargs):
+        return good if 'coach' in messages[0]['content'].lower() else bad
+    return chat
+
+
+def find_call(mock_chat, user_content: str):
+    """Find the chat call whose user message matches, regardless of call order."""
+    for call in mock_chat.call_args_list:
+        messages = call[0][0]
+        if messages[-1]['content'] == user_content:
+            return messages
+    raise AssertionError(f"No chat call for {user_content!r}")
 
 
 class TestPromptDemonstratorWithoutAI:
@@ -127,10 +145,10 @@ class TestPromptDemonstratorWithAI:
     def test_demonstrate_with_ai_client(self):
         """Should use real API when AI client provided."""
         mock_ai = Mock()
-        mock_ai.chat = Mock(side_effect=[
+        mock_ai.chat = Mock(side_effect=respond_by_system_prompt(
             "Minimal unhelpful response",
             "Detailed helpful educational response"
-        ])
+        ))
         
         demonstrator = PromptDemonstrator(ai_client=mock_ai)
         
@@ -151,9 +169,8 @@ class TestPromptDemonstratorWithAI:
         
         result = demonstrator.demonstrate("Test prompt")
         
-        # Check first call (bad response) had unhelpful system prompt
-        first_call_args = mock_ai.chat.call_args_list[0]
-        messages = first_call_args[0][0]
+        # Check the call for the original prompt had unhelpful system prompt
+        messages = find_call(mock_ai.chat, "Test prompt")
         system_message = messages[0]
         
         assert system_message['role'] == 'system'
@@ -168,14 +185,126 @@ class TestPromptDemonstratorWithAI:
         
         result = demonstrator.demonstrate("Test prompt")
         
-        # Check second call (good response) had helpful system prompt
-        second_call_args = mock_ai.chat.call_args_list[1]
-        messages = second_call_args[0][0]
+        # Check the call for the improved prompt had helpful system prompt
+        messages = find_call(mock_ai.chat, result.improved_prompt)
         system_message = messages[0]
         
         assert system_message['role'] == 'system'
         assert 'coach' in system_message['content'].lower() or 'teach' in system_message['content'].lower()
     
+    def test_passes_completion_options_per_side(self):
+        """Should send each side its own configurable completion options."""
+        mock_ai = Mock()
+        mock_ai.chat = Mock(return_value="Mock response")
+        
+        demonstrator = PromptDemonstrator(
+            ai_client=mock_ai,
+            bad_response_options={"max_tokens": 50},
+            good_response_options={"max_tokens": 300, "temperature": 0.1}
+        )
+        
+        result = demonstrator.demonstrate("Test prompt")
+        
+        options = {
+            call.args[0][1]['content']: call.kwargs
+            for call in mock_ai.chat.call_args_list
+        }
+        assert options["Test prompt"] == {"max_tokens": 50}
+        assert options[result.improved_prompt] == {"max_tokens": 300, "temperature": 0.1}
+    
+    def test_responses_are_fetched_concurrently(self):
+        """Should have both API calls in flight at the same time."""
+        both_in_flight = threading.Barrier(2, timeout=5)
+        
+        def chat(messages, **kwargs):
+            both_in_flight.wait()
+            return "Response"
+        
+        mock_ai = Mock()
+        mock_ai.chat = Mock(side_effect=chat)
+        
+        demonstrator = PromptDemonstrator(ai_client=mock_ai)
+        
+        result = demonstrator.demonstrate("Explain Python decorators")
+        
+        # A sequential implementation would break the barrier and fall back
+        assert result.is_simulated is False
+        assert mock_ai.chat.call_count == 2
+    
+    def test_streams_deltas_for_both_sides(self):
+        """Should report streamed text per side and return the joined responses."""
+        def stream_chat(messages, **kwargs):
+            if 'coach' in messages[0]['content'].lower():
+                return iter(["Detailed ", "helpful"])
+            return iter(["Minimal ", "answer"])
+        
+        mock_ai = Mock()
+        mock_ai.stream_chat = Mock(side_effect=stream_chat)
+        received = {"bad": [], "good": []}
+        
+        demonstrator = PromptDemonstrator(ai_client=mock_ai)
+        
+        result = demonstrator.demonstrate(
+            "Explain Python decorators",
+            on_delta=lambda side, text: received[side].append(text)
+        )
+        
+        assert result.is_simulated is False
+        assert result.bad_response == "Minimal answer"
+        assert result.good_response == "Detailed helpful"
+        assert received == {"bad": ["Minimal ", "answer"], "good": ["Detailed ", "helpful"]}
+        mock_ai.chat.assert_not_called()
+    
+    def test_stream_falls_back_to_chat_for_plain_clients(self):
+        """Should stream a whole chat() response from clients without streaming."""
+        class PlainClient(IAIClient):
+            def chat(self, messages, **kwargs):
+                return "Whole response"
+            
+            def analyze_prompt_intent(self, prompt):
+                return {}
+        
+        received = []
+        demonstrator = PromptDemonstrator(ai_client=PlainClient())
+        
+        result = demonstrator.demonstrate(
+            "Test prompt",
+            on_delta=lambda side, text: received.append((side, text))
+        )
+        
+        assert result.bad_response == "Whole response"
+        assert sorted(received) == [("bad", "Whole response"), ("good", "Whole response")]
+    
+    def test_cached_responses_skip_api(self):
+        """Should reuse cached live responses for a repeated prompt pair."""
+        mock_ai = Mock()
+        mock_ai.chat = Mock(side_effect=respond_by_system_prompt("Bad", "Good"))
+        cache = {}
+        
+        demonstrator = PromptDemonstrator(ai_client=mock_ai, response_cache=cache)
+        
+        first = demonstrator.demonstrate("Explain Python decorators")
+        second = demonstrator.demonstrate("Explain Python decorators")
+        
+        assert mock_ai.chat.call_count == 2  # Only the first demonstration
+        assert len(cache) == 1
+        assert second.is_simulated is False
+        assert (second.bad_response, second.good_response) == ("Bad", "Good")
+        assert (first.bad_response, first.good_response) == ("Bad", "Good")
+    
+    def test_simulated_fallback_is_not_cached(self):
+        """Should not cache fallback responses when the API fails."""
+        mock_ai = Mock()
+        mock_ai.chat = Mock(side_effect=Exception("API Error"))
+        cache = {}
+        
+        demonstrator = PromptDemonstrator(ai_client=mock_ai, response_cache=cache)
+        
+        result = demonstrator.demonstrate("Test prompt")
+        
+        assert result.is_simulated is True
+        assert cache == {}
+    
     def test_fallback_to_simulated_on_api_error(self):
         """Should fall back to simulated if API fails."""
         mock_ai = Mock()
@@ -6,26 +6,54 @@ Following TDD - these tests verify the scoring logic.
 
 import pytest
 from src.services.score_strategies import RubricScorer
-from src.models import PromptIntent, PromptScore, ScoreWeights
+from src.models import PromptIntent, PromptScore, PromptView, ScoreWeights
 from src.interfaces import IScoreStrategy
 
+# (prompt, expected intent) for the intent classifier
+INTENT_CASES = [
+    # Do it for me
+    ("Write my essay", PromptIntent.DO_IT_FOR_ME),
+    ("Do my homework", PromptIntent.DO_IT_FOR_ME),
+    ("Solve this for me", PromptIntent.DO_IT_FOR_ME),
+    ("Complete this assignment", PromptIntent.DO_IT_FOR_ME),
+    # Help me learn
+    ("Explain photosynthesis", PromptIntent.HELP_ME_LEARN),
+    ("Teach me about Python", PromptIntent.HELP_ME_LEARN),
+    ("Help me understand quantum physics", PromptIntent.HELP_ME_LEARN),
+    ("Show me how to solve this", PromptIntent.HELP_ME_LEARN),
+    ("Walk me through the steps", PromptIntent.HELP_ME_LEARN),
+    # Clarifying
+    ("What do you mean by polymorphism?", PromptIntent.CLARIFYING),
+    ("Can you clarify that concept?", PromptIntent.CLARIFYING),
+    ("What is the difference between X and Y?", PromptIntent.CLARIFYING),
+    # Reflection
+    ("How does this relate to what we learned before?", PromptIntent.REFLECTION),
+    ("Why is this important?", PromptIntent.REFLECTION),
+    ("What if we tried a different approach?", PromptIntent.REFLECTION),
+]
+
 
 class TestRubricScorer:
     """Test RubricScorer implementation."""
     
     @pytest.mark.unit
-    def test_rubric_scorer_implements_interface(self):
+    def test_rubric_scorer_implements_interface(self, rubric_scorer):
         """Test that RubricScorer implements IScoreStrategy."""
-        scorer = RubricScorer()
-        assert isinstance(scorer, IScoreStrategy)
+        assert isinstance(rubric_scorer, IScoreStrategy)
+    
+    @pytest.mark.unit
+    def test_score_view_matches_calculate_score(self, rubric_scorer):
+        """Test that scoring a prebuilt PromptView gives the same score."""
+        prompt = "  Explain Python decorators, then quiz me?  "
+        
+        assert rubric_scorer.score_view(PromptView.of(prompt)) == rubric_scorer.calculate_score(prompt)
     
     @pytest.mark.unit
-    def test_score_good_learning_prompt(self):
+    def test_score_good_learning_prompt(self, rubric_scorer):
         """Test scoring a good learning-oriented prompt."""
-        scorer = RubricScorer()
         prompt = "Explain Python decorators with examples, then quiz me to check my understanding"
         
-        score = scorer.calculate_score(prompt)
+        score = rubric_scorer.calculate_score(prompt)
         
         assert isinstance(score, PromptScore)
         assert score.total_score > 60  # Should pass
@@ -33,12 +61,11 @@ class TestRubricScorer:
         assert score.learning_orientation >= 60
     
     @pytest.mark.unit
-    def test_score_bad_do_it_for_me_prompt(self):
+    def test_score_bad_do_it_for_me_prompt(self, rubric_scorer):
         """Test scoring a 'do it for me' prompt."""
-        scorer = RubricScorer()
         prompt = "Write my essay about climate change"
         
-        score = scorer.calculate_score(prompt)
+        score = rubric_scorer.calculate_score(prompt)
         
         assert isinstance(score, PromptScore)
         assert score.total_score < 60  # Should fail
@@ -46,22 +73,20 @@ class TestRubricScorer:
         assert score.learning_orientation < 50
     
     @pytest.mark.unit
-    def test_score_vague_prompt(self):
+    def test_score_vague_prompt(self, rubric_scorer):
         """Test scoring a vague prompt."""
-        scorer = RubricScorer()
         prompt = "Help me"
         
-        score = scorer.calculate_score(prompt)
+        score = rubric_scorer.calculate_score(prompt)
         
         assert score.specificity < 50  # Too vague
     
     @pytest.mark.unit
-    def test_score_interactive_prompt(self):
+    def test_score_interactive_prompt(self, rubric_scorer):
         """Test scoring an interactive prompt."""
-        scorer = RubricScorer()
         prompt = "Teach me about Python, quiz me on key concepts, then give me practice problems"
         
-        score = scorer.calculate_score(prompt)
+        score = rubric_scorer.calculate_score(prompt)
         
         assert score.engagement > 60  # Should be high engagement
         assert score.intent == PromptIntent.HELP_ME_LEARN
@@ -81,124 +106,86 @@ class TestRubricScorer:
         assert scorer.weights.engagement == 0.2
     
     @pytest.mark.unit
-    def test_classify_intent_do_it_for_me(self):
-        """Test intent classification for 'do it for me'."""
-        scorer = RubricScorer()
-        
-        prompts = [
-            "Write my essay",
-            "Do my homework",
-            "Solve this for me",
-            "Complete this assignment"
-        ]
-        
-        for prompt in prompts:
-            score = scorer.calculate_score(prompt)
-            assert score.intent == PromptIntent.DO_IT_FOR_ME, f"Failed for: {prompt}"
-    
-    @pytest.mark.unit
-    def test_classify_intent_help_me_learn(self):
-        """Test intent classification for learning."""
-        scorer = RubricScorer()
-        
-        prompts = [
-            "Explain photosynthesis",
-            "Teach me about Python",
-            "Help me understand quantum physics",
-            "Show me how to solve this",
-            "Walk me through the steps"
-        ]
-        
-        for prompt in prompts:
-            score = scorer.calculate_score(prompt)
-            assert score.intent == PromptIntent.HELP_ME_LEARN, f"Failed for: {prompt}"
-    
-    @pytest.mark.unit
-    def test_classify_intent_clarifying(self):
-        """Test intent classification for clarifying questions."""
-        scorer = RubricScorer()
-        
-        prompts = [
-            "What do you mean by polymorphism?",
-            "Can you clarify that concept?",
-            "What is the difference between X and Y?"
-        ]
-        
-        for prompt in prompts:
-            score = scorer.calculate_score(prompt)
-            assert score.intent == PromptIntent.CLARIFYING, f"Failed for: {prompt}"
-    
-    @pytest.mark.unit
-    def test_classify_intent_reflection(self):
-        """Test intent classification for reflection."""
-        scorer = RubricScorer()
-        
-        prompts = [
-            "How does this relate to what we learned before?",
-            "Why is this important?",
-            "What if we tried a different approach?"
-        ]
-        
-        for prompt in prompts:
-            score = scorer.calculate_score(prompt)
-            assert score.intent == PromptIntent.REFLECTION, f"Failed for: {prompt}"
+    @pytest.mark.parametrize("prompt, expected", INTENT_CASES)
+    def test_classify_intent(self, rubric_scorer, prompt, expected):
+        """Test intent classification for each kind of prompt."""
+        assert rubric_scorer.calculate_score(prompt).intent == expected
     
     @pytest.mark.unit
-    def test_score_ranges(self):
+    @pytest.mark.parametrize("prompt", [
+        "Write my code",
+        "Explain everything",
+        "Help me understand this specific concept about Python decorators",
+        "Quiz me on what we just discussed, then give me harder problems",
+    ])
+    def test_score_ranges(self, rubric_scorer, prompt):
         """Test that all scores are in valid range 0-100."""
-        scorer = RubricScorer()
-        
-        prompts = [
-            "Write my code",
-            "Explain everything",
-            "Help me understand this specific concept about Python decorators",
-            "Quiz me on what we just discussed, then give me harder problems"
-        ]
-        
-        for prompt in prompts:
-            score = scorer.calculate_score(prompt)
-            assert 0 <= score.total_score <= 100
-            assert 0 <= score.learning_orientation <= 100
-            assert 0 <= score.specificity <= 100
-            assert 0 <= score.engagement <= 100
+        score = rubric_scorer.calculate_score(prompt)
+        assert 0 <= score.total_score <= 100
+        assert 0 <= score.learning_orientation <= 100
+        assert 0 <= score.specificity <= 100
+        assert 0 <= score.engagement <= 100
     
     @pytest.mark.unit
-    def test_learning_orientation_keywords(self):
+    def test_learning_orientation_keywords(self, rubric_scorer):
         """Test learning orientation scoring with keywords."""
-        scorer = RubricScorer()
-        
         # Good keywords should increase score
         good_prompt = "Explain how recursion works and help me understand the base case"
-        good_score = scorer._score_learning_orientation(good_prompt)
+        good_score = rubric_scorer._score_learning_orientation(good_prompt)
         
         # Bad keywords should decrease score
         bad_prompt = "Just tell me the answer and give me the solution"
-        bad_score = scorer._score_learning_orientation(bad_prompt)
+        bad_score = rubric_scorer._score_learning_orientation(bad_prompt)
         
         assert good_score > bad_score
     
     @pytest.mark.unit
-    def test_specificity_by_length(self):
+    def test_specificity_by_length(self, rubric_scorer):
         """Test that prompt length affects specificity score."""
-        scorer = RubricScorer()
-        
         short_prompt = "Help"
         medium_prompt = "Help me understand Python decorators and when to use them"
         
-        short_score = scorer._score_specificity(short_prompt)
-        medium_score = scorer._score_specificity(medium_prompt)
+        short_score = rubric_scorer._score_specificity(short_prompt)
+        medium_score = rubric_scorer._score_specificity(medium_prompt)
         
         assert medium_score > short_score
     
     @pytest.mark.unit
-    def test_engagement_with_steps(self):
+    def test_engagement_with_steps(self, rubric_scorer):
         """Test that multi-step prompts score higher on engagement."""
-        scorer = RubricScorer()
-        
         single_step = "Explain Python"
         multi_step = "Explain Python, then quiz me, then give me practice problems"
         
-        single_score = scorer._score_engagement(single_step)
-        multi_score = scorer._score_engagement(multi_step)
+        single_score = rubric_scorer._score_engagement(single_step)
+        multi_score = rubric_scorer._score_engagement(multi_step)
         
         assert multi_score > single_score
+    
+    @pytest.mark.unit
+    def test_cached_score_follows_weights(self):
+        """Test that changing weights is not hidden by cached scores."""
+        scorer = RubricScorer()
+        prompt = "Explain Python decorators, then quiz me"
+        
+        default_score = scorer.calculate_score(prompt)
+        assert scorer.calculate_score(prompt) is default_score
+        
+        scorer.weights = ScoreWeights(learning_orientation=0.2, specificity=0.6, engagement=0.2)
+        
+        assert scorer.calculate_score(prompt).total_score != default_score.total_score
+    
+    @pytest.mark.unit
+    def test_total_matches_weighted_sum(self):
+        """Test that totals equal the rounded weighted sum for any weights."""
+        prompt = "Explain Python decorators specifically, then quiz me?"
+        
+        for weights in (ScoreWeights(), ScoreWeights(0.5, 0.25, 0.25)):
+            score = RubricScorer(weights).calculate_score(prompt)
+            expected = round(
+                score.learning_orientation * weights.learning_orientation +
+                score.specificity * weights.specificity +
+                score.engagement * weights.engagement,
+                1
+            )
+            
+            assert score.total_score == expected
@@ -0,0 +1,58 @@
+"""
+Unit tests for the service interface base.
+
+Verifies abstract methods are enforced without ABCMeta.
+"""
+
+import pytest
+from src.interfaces import IAIClient, IScoreStrategy
+from src.models import PromptIntent, PromptScore, PromptView
+
+
+class TestFastInterface:
+    """Test abstract method enforcement on interfaces."""
+    
+    @pytest.mark.unit
+    def test_interface_cannot_be_instantiated(self):
+        """Test that an interface with abstract methods cannot be created."""
+        with pytest.raises(TypeError):
+            IScoreStrategy()
+    
+    @pytest.mark.unit
+    def test_partial_implementation_stays_abstract(self):
+        """Test that inherited abstract methods must all be overridden."""
+        class PartialClient(IAIClient):
+            def chat(self, messages, **kwargs):
+                return "response"
+        
+        with pytest.raises(TypeError):
+            PartialClient()
+    
+    @pytest.mark.unit
+    def test_complete_implementation_is_instance(self):
+        """Test that a full implementation instantiates and passes isinstance."""
+        class FixedClient(IAIClient):
+            def chat(self, messages, **kwargs):
+                return "response"
+            
+            def analyze_prompt_intent(self, prompt):
+                return None
+        
+        client = FixedClient()
+        
+        assert isinstance(client, IAIClient)
+        assert not isinstance(client, IScoreStrategy)
+        assert list(client.stream_chat([])) == ["response"]
+    
+    @pytest.mark.unit
+    def test_default_score_view_scores_raw_prompt(self):
+        """Test that strategies without score_view are scored on view.raw."""
+        class EchoScorer(IScoreStrategy):
+            def calculate_score(self, prompt):
+                self.seen = prompt
+                return PromptScore(50.0, 50.0, 50.0, 50.0, PromptIntent.UNKNOWN)
+        
+        scorer = EchoScorer()
+        scorer.score_view(PromptView.of(" Teach ME "))
+        
+        assert scorer.seen == " Teach ME "